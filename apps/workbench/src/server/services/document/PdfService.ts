@@ -5,7 +5,7 @@
  */
 
 import { PdfExtractor, type PdfExtractionResult } from '@artificer/document-converter';
-import { OCRService } from '../image/OCRService';
+import { OCRService, estimateOCRCost } from '../image/OCRService';
 import { logger } from '../../utils/logger';
 
 export interface PdfProcessingResult {
@@ -168,12 +168,9 @@ export class PdfService {
     const extraction = await this.pdfExtractor.extractText(buffer);
     const needsOCR = this.pdfExtractor.needsOCR(extraction, minTextThreshold);
 
-    // Rough cost estimate for OpenAI Vision OCR
-    // Assuming ~1000 tokens per page with gpt-4o-mini
-    const estimatedTokensPerPage = 1000;
-    const costPer1MTokens = 0.15; // gpt-4o-mini input
+    // Rough cost estimate for OpenAI Vision OCR, priced for the model OCR would use
     const estimatedOCRCost = needsOCR
-      ? (extraction.pages * estimatedTokensPerPage * costPer1MTokens) / 1_000_000
+      ? this.ocrService?.estimatePdfCost(extraction.pages) ?? estimateOCRCost(extraction.pages)
       : undefined;
 
     return {
@@ -5,50 +5,109 @@
  */
 
 import { OpenAI } from 'openai';
+import { ImageExtractor, PdfExtractor } from '@artificer/document-converter';
 import type { OCRProvider, OCRResult } from '@artificer/document-converter';
 import { logger } from '../../utils/logger';
 import { fromBuffer } from 'pdf2pic';
+import crypto from 'crypto';
 import fs from 'fs/promises';
 import path from 'path';
 import os from 'os';
-import { circuitBreakerRegistry } from '../../utils/CircuitBreaker';
-
-// Type for pdf-parse function
-type PdfParseResult = {
-  numpages: number;
-  info?: Record<string, any>;
-  text: string;
-};
-type PdfParseFunction = (buffer: Buffer) => Promise<PdfParseResult>;
+import { circuitBreakerRegistry, type CircuitBreakerConfig } from '../../utils/CircuitBreaker';
 
 // Constants
 const MAX_IMAGE_SIZE_BYTES = 20 * 1024 * 1024; // 20MB
 const API_TIMEOUT_MS = 30 * 1000; // 30 seconds for OpenAI API calls
 const MAX_PDF_PAGES_FOR_OCR = 100; // Maximum pages to OCR (safety limit)
+const PDF_RENDER_CONCURRENCY = 2; // PDF pages rasterized at once (bounds GraphicsMagick memory and CPU)
+const MAX_RESULT_CACHE_SIZE = 1024; // OCR results kept for re-submitted images
+const DEFAULT_MAX_IMAGE_SIDE = 2048; // Longest side of images sent for OCR after downscaling
+const LOW_DETAIL_MAX_SIDE = 512; // Low detail sees the image at 512x512, so smaller images lose nothing
+
+// Shared by OCR and image analysis, which both call OpenAI Vision through one breaker
+const OPENAI_CIRCUIT_BREAKER_CONFIG: Partial<CircuitBreakerConfig> = {
+  failureThreshold: 5,
+  successThreshold: 2,
+  timeout: 60000, // 1 minute
+};
+
+// USD per 1M tokens for the supported OpenAI Vision models
+const OPENAI_VISION_PRICING = new Map<string, { input: number; output: number }>([
+  ['gpt-4o', { input: 2.5, output: 10 }],
+  ['gpt-4o-mini', { input: 0.15, output: 0.6 }],
+]);
+const DEFAULT_OCR_MODEL = 'gpt-4o-mini';
+const ESTIMATED_TOKENS_PER_PAGE = 1000; // Rough image input tokens for one OCR'd PDF page
+
+/**
+ * Rough up-front cost of OCRing a PDF with OpenAI Vision
+ * Only image input tokens are counted; unknown models are estimated at zero.
+ */
+export function estimateOCRCost(pageCount: number, model: string = DEFAULT_OCR_MODEL): number {
+  const pricing = OPENAI_VISION_PRICING.get(model);
+  if (!pricing) {
+    return 0;
+  }
+  return (pageCount * ESTIMATED_TOKENS_PER_PAGE * pricing.input) / 1_000_000;
+}
+
+const imageExtractor = new ImageExtractor();
+const pdfExtractor = new PdfExtractor();
+
+// OpenAI clients shared by every OCRService using the same API key, so
+// separately constructed services reuse one client and its connections
+const openaiClients = new Map<string, OpenAI>();
+
+/**
+ * SHA-256 of the image bytes, used as the cache identity of an image
+ */
+function hashImage(buffer: Buffer): string {
+  return crypto.createHash('sha256').update(buffer).digest('hex');
+}
+
+function getOpenAIClient(apiKey: string): OpenAI {
+  let client = openaiClients.get(apiKey);
+  if (!client) {
+    client = new OpenAI({ apiKey });
+    openaiClients.set(apiKey, client);
+  }
+  return client;
+}
 
 export interface OCRServiceConfig {
   provider: 'openai-vision' | 'tesseract';
   openaiApiKey?: string;
   model?: string; // 'gpt-4o' or 'gpt-4o-mini'
   maxRetries?: number;
+  resizeImages?: boolean; // Downscale large images before upload (default: true)
+  grayscaleImages?: boolean; // Send contrast-stretched grayscale images for OCR (default: false, needs resizeImages)
+  maxImageSide?: number; // Longest side in pixels after downscaling (default: 2048)
+  // Vision detail level; 'adaptive' uses low detail for images that fit in one 512px tile (default: 'adaptive')
+  imageDetail?: 'low' | 'high' | 'adaptive';
 }
 
 export class OCRService implements OCRProvider {
   private openai?: OpenAI;
   private config: Required<OCRServiceConfig>;
+  // OCR results keyed by SHA-256 of the image bytes (Map order tracks recency for LRU)
+  private resultCache = new Map<string, OCRResult>();
+  // OCR calls currently running, keyed like resultCache, so duplicates can await them
+  private inFlightRequests = new Map<string, Promise<OCRResult>>();
 
   constructor(config: OCRServiceConfig) {
     this.config = {
       provider: config.provider,
       openaiApiKey: config.openaiApiKey || process.env.OPENAI_API_KEY || '',
-      model: config.model || 'gpt-4o-mini',
-      maxRetries: config.maxRetries || 3,
+      model: config.model || DEFAULT_OCR_MODEL,
+      maxRetries: config.maxRetries ?? 3,
+      resizeImages: config.resizeImages ?? true,
+      grayscaleImages: config.grayscaleImages ?? false,
+      maxImageSide: config.maxImageSide || DEFAULT_MAX_IMAGE_SIDE,
+      imageDetail: config.imageDetail || 'adaptive',
     };
 
     if (this.config.provider === 'openai-vision' && this.config.openaiApiKey) {
-      this.openai = new OpenAI({
-        apiKey: this.config.openaiApiKey,
-      });
+      this.openai = getOpenAIClient(this.config.openaiApiKey);
     }
   }
 
@@ -60,7 +119,47 @@ export class OCRService implements OCRProvider {
 
     try {
       if (this.config.provider === 'openai-vision') {
-        return await this.extractWithOpenAI(buffer, contentType, startTime);
+        // Retries, reprocessing and duplicate uploads resend identical bytes;
+        // hashing is far cheaper than another billed API round-trip
+        const cacheKey = hashImage(buffer);
+        const cached = this.getCachedResult(cacheKey);
+        if (cached) {
+          return {
+            ...cached,
+            metadata: {
+              ...cached.metadata,
+              processingTime: Date.now() - startTime,
+              tokensUsed: 0,
+              cost: 0,
+              cacheHit: true,
+            },
+          };
+        }
+
+        // Identical images submitted concurrently (e.g. duplicate uploads in a burst)
+        // share one API call instead of each paying for their own
+        const pending = this.inFlightRequests.get(cacheKey);
+        if (pending) {
+          const shared = await pending;
+          return {
+            ...shared,
+            metadata: {
+              ...shared.metadata,
+              processingTime: Date.now() - startTime,
+              tokensUsed: 0,
+              cost: 0,
+              coalesced: true,
+            },
+          };
+        }
+
+        const request = this.extractUncached(buffer, contentType, cacheKey, startTime);
+        this.inFlightRequests.set(cacheKey, request);
+        try {
+          return await request;
+        } finally {
+          this.inFlightRequests.delete(cacheKey);
+        }
       } else {
         throw new Error(`OCR provider '${this.config.provider}' not yet implemented`);
       }
@@ -74,25 +173,154 @@ export class OCRService implements OCRProvider {
     }
   }
 
+  /**
+   * OCR an image that is neither cached nor already being processed
+   */
+  private async extractUncached(
+    buffer: Buffer,
+    contentType: string,
+    cacheKey: string,
+    startTime: number
+  ): Promise<OCRResult> {
+    const upload = await this.prepareImageForUpload(buffer, contentType);
+
+    // Blank pages (common in scanned PDFs) have nothing to read; skip the API call
+    if (upload.isBlank) {
+      const result: OCRResult = {
+        text: '[No text found]',
+        confidence: 1,
+        metadata: {
+          processingTime: Date.now() - startTime,
+          provider: this.config.provider,
+          model: this.config.model,
+          tokensUsed: 0,
+          cost: 0,
+          skippedBlank: true,
+        },
+      };
+      this.cacheResult(cacheKey, result);
+      return result;
+    }
+
+    const result = await this.extractWithOpenAI(
+      upload.buffer,
+      upload.contentType,
+      startTime,
+      this.getImageDetail(upload.width, upload.height)
+    );
+    this.cacheResult(cacheKey, result);
+    return result;
+  }
+
+  /**
+   * Check for a blank image without failing OCR when the image cannot be decoded locally
+   */
+  private async isBlankImage(buffer: Buffer): Promise<boolean> {
+    try {
+      return await imageExtractor.isBlankImage(buffer);
+    } catch (error) {
+      logger.debug('Blank image check failed, sending image to OCR', {
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
+      return false;
+    }
+  }
+
+  /**
+   * Downscale oversized images (e.g. 300+ DPI scans) before sending them to OpenAI
+   * Vision bills high-detail images per 512px tile and every byte is base64-encoded
+   * and uploaded, so a 2048px JPEG is much cheaper and faster than the original.
+   * With grayscaleImages, scans are also converted to grayscale so faint text on
+   * colored or uneven backgrounds reads more reliably.
+   * The blank check shares the resize's decode, so each image is decoded once.
+   * Falls back to the original image if it cannot be processed locally.
+   */
+  private async prepareImageForUpload(
+    buffer: Buffer,
+    contentType: string
+  ): Promise<{
+    buffer: Buffer;
+    contentType: string;
+    width?: number;
+    height?: number;
+    isBlank: boolean;
+  }> {
+    if (!this.config.resizeImages) {
+      return { buffer, contentType, isBlank: await this.isBlankImage(buffer) };
+    }
+
+    try {
+      return await imageExtractor.prepareForOCR(buffer, contentType, {
+        maxSide: this.config.maxImageSide,
+        grayscale: this.config.grayscaleImages,
+      });
+    } catch (error) {
+      logger.debug('Image preparation failed, sending original image to OCR', {
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
+      return { buffer, contentType, isBlank: false };
+    }
+  }
+
+  /**
+   * Vision detail level for OCR of an image
+   * Low detail is billed as a single fixed-price tile instead of one per 512px
+   * tile, and an image that already fits in 512px loses nothing by it.
+   * Unknown sizes get high detail.
+   */
+  private getImageDetail(width?: number, height?: number): 'low' | 'high' {
+    if (this.config.imageDetail !== 'adaptive') {
+      return this.config.imageDetail;
+    }
+
+    if (width && height && width <= LOW_DETAIL_MAX_SIDE && height <= LOW_DETAIL_MAX_SIDE) {
+      return 'low';
+    }
+    return 'high';
+  }
+
+  /**
+   * Look up a cached OCR result, marking it most recently used
+   */
+  private getCachedResult(cacheKey: string): OCRResult | undefined {
+    const cached = this.resultCache.get(cacheKey);
+    if (cached) {
+      // LRU: Move to end (most recently used)
+      this.resultCache.delete(cacheKey);
+      this.resultCache.set(cacheKey, cached);
+    }
+    return cached;
+  }
+
+  /**
+   * Cache an OCR result, evicting the least recently used entry when full
+   */
+  private cacheResult(cacheKey: string, result: OCRResult): void {
+    if (this.resultCache.size >= MAX_RESULT_CACHE_SIZE) {
+      // Map maintains insertion order, so first key is least recently used
+      const firstKey = this.resultCache.keys().next().value;
+      if (firstKey) {
+        this.resultCache.delete(firstKey);
+      }
+    }
+    this.resultCache.set(cacheKey, result);
+  }
+
   /**
    * Extract text from PDF using OCR with parallel page processing
    * For scanned PDFs that don't have embedded text
    *
    * This method:
    * 1. Converts each PDF page to an image
-   * 2. Processes pages in parallel using OCR
+   * 2. OCRs pages in parallel, starting each page as soon as it is rendered
    * 3. Combines text results in page order
    */
   async extractTextFromPdf(buffer: Buffer): Promise<OCRResult> {
     const startTime = Date.now();
 
     try {
-      // Get PDF metadata to determine page count
-      // Use dynamic import to handle ESM/CJS compatibility
-      const pdfParseModule = await import('pdf-parse');
-      const pdfParse = (pdfParseModule as any).default || pdfParseModule as unknown as PdfParseFunction;
-      const data = await pdfParse(buffer);
-      const pageCount = data.numpages || 0;
+      // Get PDF metadata to determine page count (without extracting page text)
+      const { pages: pageCount } = await pdfExtractor.getMetadata(buffer);
 
       logger.info('Starting PDF OCR with parallel page processing', {
         pageCount,
@@ -114,38 +342,35 @@ export class OCRService implements OCRProvider {
       const tempDir = await fs.mkdtemp(path.join(os.tmpdir(), 'pdf-ocr-'));
 
       try {
-        // Convert PDF pages to images
-        const pageImages = await this.extractPdfPagesToImages(buffer, tempDir, pageCount);
-
-        // Process all pages in parallel using batch OCR
+        // Render and OCR pages as a pipeline: OCR of early pages overlaps with
+        // rendering of later ones instead of waiting for the whole document
         logger.info('Processing PDF pages with OCR', {
           pageCount,
           concurrency: 3,
         });
 
-        const pageResults = await this.extractTextBatch(pageImages, { concurrency: 3 });
+        const pageResults: OCRResult[] = new Array(pageCount);
+        const pageImages = this.renderPdfPages(buffer, tempDir, pageCount);
+        for await (const { index, result } of this.iterateTextBatch(pageImages, { concurrency: 3 })) {
+          pageResults[index] = result;
+        }
 
-        // Combine page texts in order
-        const combinedText = pageResults
-          .map((result, idx) => {
-            const pageNum = idx + 1;
-            return `--- Page ${pageNum} ---\n${result.text}`;
-          })
-          .join('\n\n');
+        // Combine page texts in order and total the metrics in a single pass
+        const pageTexts: string[] = new Array(pageResults.length);
+        let totalTokens = 0;
+        let totalCost = 0;
+        let totalConfidence = 0;
+
+        for (let idx = 0; idx < pageResults.length; idx++) {
+          const result = pageResults[idx];
+          pageTexts[idx] = `--- Page ${idx + 1} ---\n${result.text}`;
+          totalTokens += result.metadata.tokensUsed || 0;
+          totalCost += result.metadata.cost || 0;
+          totalConfidence += result.confidence;
+        }
 
-        // Calculate combined metrics
-        const totalTokens = pageResults.reduce(
-          (sum, result) => sum + (result.metadata.tokensUsed || 0),
-          0
-        );
-        const totalCost = pageResults.reduce(
-          (sum, result) => sum + (result.metadata.cost || 0),
-          0
-        );
-        const avgConfidence = pageResults.reduce(
-          (sum, result) => sum + result.confidence,
-          0
-        ) / pageResults.length;
+        const combinedText = pageTexts.join('\n\n');
+        const avgConfidence = totalConfidence / pageResults.length;
 
         const processingTime = Date.now() - startTime;
 
@@ -191,14 +416,15 @@ export class OCRService implements OCRProvider {
   }
 
   /**
-   * Convert PDF pages to images for OCR processing
+   * Convert PDF pages to images for OCR processing, yielding each page once rendered
+   * Pages are yielded in order, with up to PDF_RENDER_CONCURRENCY renders running ahead.
    * @private
    */
-  private async extractPdfPagesToImages(
+  private async *renderPdfPages(
     buffer: Buffer,
     tempDir: string,
     pageCount: number
-  ): Promise<Array<{ buffer: Buffer; contentType: string }>> {
+  ): AsyncGenerator<{ buffer: Buffer; contentType: string }> {
     const converter = fromBuffer(buffer, {
       density: 200, // DPI - higher = better quality but larger files
       saveFilename: 'page',
@@ -208,46 +434,66 @@ export class OCRService implements OCRProvider {
       height: 2000, // Max height in pixels
     });
 
-    const pageImages: Array<{ buffer: Buffer; contentType: string }> = [];
+    // Renders are independent and returned as buffers, so they can overlap; each one is
+    // a GraphicsMagick process holding a full page bitmap, so the count stays small
+    const renders: Array<Promise<{ buffer: Buffer; contentType: string }>> = [];
+    let nextPage = 1;
 
-    // Convert each page to an image
-    for (let pageNum = 1; pageNum <= pageCount; pageNum++) {
-      try {
-        const result = await converter(pageNum, { responseType: 'buffer' });
-
-        if (!result?.buffer) {
-          logger.warn('Failed to convert PDF page to image', { pageNum });
-          // Create placeholder for failed page
-          pageImages.push({
-            buffer: Buffer.from('[Failed to extract page image]'),
-            contentType: 'text/plain',
-          });
-          continue;
-        }
+    while (nextPage <= pageCount && renders.length < PDF_RENDER_CONCURRENCY) {
+      renders.push(this.renderPdfPage(converter, nextPage++));
+    }
 
-        pageImages.push({
-          buffer: result.buffer,
-          contentType: 'image/png',
-        });
+    while (renders.length > 0) {
+      const pageImage = await renders.shift()!;
+      if (nextPage <= pageCount) {
+        renders.push(this.renderPdfPage(converter, nextPage++));
+      }
+      yield pageImage;
+    }
+  }
 
+  /**
+   * Convert a single PDF page to an image, or a placeholder if conversion fails
+   * @private
+   */
+  private async renderPdfPage(
+    converter: ReturnType<typeof fromBuffer>,
+    pageNum: number
+  ): Promise<{ buffer: Buffer; contentType: string }> {
+    try {
+      const result = await converter(pageNum, { responseType: 'buffer' });
+
+      if (!result?.buffer) {
+        logger.warn('Failed to convert PDF page to image', { pageNum });
+        // Create placeholder for failed page
+        return {
+          buffer: Buffer.from('[Failed to extract page image]'),
+          contentType: 'text/plain',
+        };
+      }
+
+      if (logger.isLevelEnabled('debug')) {
         logger.debug('PDF page converted to image', {
           pageNum,
           imageSize: result.buffer.length,
         });
-      } catch (error) {
-        logger.warn('Error converting PDF page to image', {
-          pageNum,
-          error: error instanceof Error ? error.message : 'Unknown error',
-        });
-        // Create placeholder for failed page
-        pageImages.push({
-          buffer: Buffer.from(`[Failed to extract page ${pageNum}]`),
-          contentType: 'text/plain',
-        });
       }
-    }
 
-    return pageImages;
+      return {
+        buffer: result.buffer,
+        contentType: 'image/png',
+      };
+    } catch (error) {
+      logger.warn('Error converting PDF page to image', {
+        pageNum,
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
+      // Create placeholder for failed page
+      return {
+        buffer: Buffer.from(`[Failed to extract page ${pageNum}]`),
+        contentType: 'text/plain',
+      };
+    }
   }
 
   /**
@@ -256,7 +502,8 @@ export class OCRService implements OCRProvider {
   private async extractWithOpenAI(
     buffer: Buffer,
     contentType: string,
-    startTime: number
+    startTime: number,
+    detail: 'low' | 'high' = 'high'
   ): Promise<OCRResult> {
     if (!this.openai) {
       throw new Error('OpenAI client not initialized. Check OPENAI_API_KEY.');
@@ -273,62 +520,59 @@ export class OCRService implements OCRProvider {
     const base64Image = buffer.toString('base64');
     const dataUrl = `data:${contentType};base64,${base64Image}`;
 
-    logger.info('Starting OpenAI Vision OCR', {
-      model: this.config.model,
-      contentType,
-      imageSize: buffer.length,
-    });
+    // Logged once per image (every page of a PDF), so skip building the metadata when filtered
+    if (logger.isLevelEnabled('info')) {
+      logger.info('Starting OpenAI Vision OCR', {
+        model: this.config.model,
+        contentType,
+        imageSize: buffer.length,
+        detail,
+      });
+    }
 
     try {
       // Get circuit breaker for OpenAI
-      const circuitBreaker = circuitBreakerRegistry.getBreaker('openai-vision', {
-        failureThreshold: 5,
-        successThreshold: 2,
-        timeout: 60000, // 1 minute
-      });
+      const circuitBreaker = circuitBreakerRegistry.getBreaker(
+        'openai-vision',
+        OPENAI_CIRCUIT_BREAKER_CONFIG
+      );
 
       // Wrap API call with circuit breaker and timeout protection
       const response = await circuitBreaker.execute(async () => {
-        return Promise.race([
-          this.openai!.chat.completions.create({
-            model: this.config.model,
-            messages: [
-              {
-                role: 'user',
-                content: [
-                  {
-                    type: 'text',
-                    text: 'Extract all text from this image verbatim. Preserve formatting, line breaks, and structure as much as possible. If there is no text in the image, respond with "[No text found]".',
-                  },
-                  {
-                    type: 'image_url',
-                    image_url: {
-                      url: dataUrl,
-                      detail: 'high', // Use 'high' for better OCR accuracy
-                    },
+        return this.createChatCompletion({
+          model: this.config.model,
+          messages: [
+            {
+              role: 'user',
+              content: [
+                {
+                  type: 'text',
+                  text: 'Extract all text from this image verbatim. Preserve formatting, line breaks, and structure as much as possible. If there is no text in the image, respond with "[No text found]".',
+                },
+                {
+                  type: 'image_url',
+                  image_url: {
+                    url: dataUrl,
+                    detail,
                   },
-                ],
-              },
-            ],
-            max_tokens: 4096,
-          }),
-          new Promise<never>((_, reject) =>
-            setTimeout(
-              () => reject(new Error(`OpenAI API call timeout after ${API_TIMEOUT_MS / 1000}s`)),
-              API_TIMEOUT_MS
-            )
-          ),
-        ]);
+                },
+              ],
+            },
+          ],
+          max_tokens: 4096,
+        });
       });
 
       const extractedText = response.choices[0]?.message?.content || '';
       const processingTime = Date.now() - startTime;
 
-      logger.info('OpenAI Vision OCR completed', {
-        textLength: extractedText.length,
-        processingTime,
-        tokensUsed: response.usage?.total_tokens,
-      });
+      if (logger.isLevelEnabled('info')) {
+        logger.info('OpenAI Vision OCR completed', {
+          textLength: extractedText.length,
+          processingTime,
+          tokensUsed: response.usage?.total_tokens,
+        });
+      }
 
       return {
         text: extractedText,
@@ -338,7 +582,7 @@ export class OCRService implements OCRProvider {
           provider: 'openai-vision',
           model: this.config.model,
           tokensUsed: response.usage?.total_tokens,
-          cost: this.calculateCost(response.usage?.total_tokens || 0),
+          cost: this.calculateCost(response.usage),
         },
       };
     } catch (error) {
@@ -381,44 +625,35 @@ export class OCRService implements OCRProvider {
 
     try {
       // Get circuit breaker for OpenAI
-      const circuitBreaker = circuitBreakerRegistry.getBreaker('openai-vision', {
-        failureThreshold: 5,
-        successThreshold: 2,
-        timeout: 60000,
-      });
+      const circuitBreaker = circuitBreakerRegistry.getBreaker(
+        'openai-vision',
+        OPENAI_CIRCUIT_BREAKER_CONFIG
+      );
 
       // Wrap API call with circuit breaker and timeout protection
       const response = await circuitBreaker.execute(async () => {
-        return Promise.race([
-          this.openai!.chat.completions.create({
-            model: this.config.model,
-            messages: [
-              {
-                role: 'user',
-                content: [
-                  {
-                    type: 'text',
-                    text: prompt,
-                  },
-                  {
-                    type: 'image_url',
-                    image_url: {
-                      url: dataUrl,
-                      detail: 'high',
-                    },
+        return this.createChatCompletion({
+          model: this.config.model,
+          messages: [
+            {
+              role: 'user',
+              content: [
+                {
+                  type: 'text',
+                  text: prompt,
+                },
+                {
+                  type: 'image_url',
+                  image_url: {
+                    url: dataUrl,
+                    detail: 'high',
                   },
-                ],
-              },
-            ],
-            max_tokens: 1024,
-          }),
-          new Promise<never>((_, reject) =>
-            setTimeout(
-              () => reject(new Error(`OpenAI API call timeout after ${API_TIMEOUT_MS / 1000}s`)),
-              API_TIMEOUT_MS
-            )
-          ),
-        ]);
+                },
+              ],
+            },
+          ],
+          max_tokens: 1024,
+        });
       });
 
       const description = response.choices[0]?.message?.content || '';
@@ -428,7 +663,7 @@ export class OCRService implements OCRProvider {
         details: {
           model: this.config.model,
           tokensUsed: response.usage?.total_tokens,
-          cost: this.calculateCost(response.usage?.total_tokens || 0),
+          cost: this.calculateCost(response.usage),
         },
       };
     } catch (error) {
@@ -440,26 +675,48 @@ export class OCRService implements OCRProvider {
   }
 
   /**
-   * Calculate approximate cost for OpenAI Vision API usage
-   * Pricing as of 2024:
-   * - gpt-4o: $2.50/1M input tokens, $10/1M output tokens
-   * - gpt-4o-mini: $0.15/1M input tokens, $0.60/1M output tokens
-   *
-   * Note: OCR/Vision workloads are heavily input-weighted (image tokens)
-   * with minimal output (extracted text), so we use 90/10 split
+   * Call the chat completions API, aborting the request after API_TIMEOUT_MS
+   * The timer is cleared once the call settles, and a timed-out request is
+   * cancelled rather than left running in the background.
+   * Rate limits (429) and server errors are retried by the SDK with backoff,
+   * up to config.maxRetries times within the same deadline.
    */
-  private calculateCost(totalTokens: number): number {
-    const tokensInMillions = totalTokens / 1_000_000;
-
-    if (this.config.model === 'gpt-4o') {
-      // OCR workload: 90% input (image), 10% output (text)
-      return tokensInMillions * (0.9 * 2.5 + 0.1 * 10);
-    } else if (this.config.model === 'gpt-4o-mini') {
-      // OCR workload: 90% input (image), 10% output (text)
-      return tokensInMillions * (0.9 * 0.15 + 0.1 * 0.6);
+  private async createChatCompletion(
+    params: OpenAI.Chat.ChatCompletionCreateParamsNonStreaming
+  ): Promise<OpenAI.Chat.ChatCompletion> {
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), API_TIMEOUT_MS);
+
+    try {
+      return await this.openai!.chat.completions.create(params, {
+        signal: controller.signal,
+        maxRetries: this.config.maxRetries,
+      });
+    } catch (error) {
+      if (controller.signal.aborted) {
+        throw new Error(`OpenAI API call timeout after ${API_TIMEOUT_MS / 1000}s`);
+      }
+      throw error;
+    } finally {
+      clearTimeout(timeoutId);
     }
+  }
 
-    return 0;
+  /**
+   * Calculate cost for OpenAI Vision API usage
+   * Bills prompt (mostly image) and completion tokens at the model's own rates;
+   * models missing from OPENAI_VISION_PRICING are reported as free.
+   */
+  private calculateCost(usage: OpenAI.Chat.ChatCompletion['usage']): number {
+    const pricing = OPENAI_VISION_PRICING.get(this.config.model);
+    if (!pricing || !usage) {
+      return 0;
+    }
+
+    return (
+      (usage.prompt_tokens * pricing.input + usage.completion_tokens * pricing.output) /
+      1_000_000
+    );
   }
 
   /**
@@ -470,54 +727,118 @@ export class OCRService implements OCRProvider {
     images: Array<{ buffer: Buffer; contentType: string }>,
     options: { concurrency?: number } = {}
   ): Promise<OCRResult[]> {
-    const concurrency = options.concurrency || 3; // Process 3 images at a time by default
     const results: OCRResult[] = new Array(images.length);
 
-    // Process images in concurrent batches
-    for (let i = 0; i < images.length; i += concurrency) {
-      const batch = images.slice(i, i + concurrency);
-      const batchPromises = batch.map(async (image, batchIdx) => {
-        const resultIdx = i + batchIdx;
-        try {
-          // Handle placeholder text content (from failed page conversions)
-          if (image.contentType === 'text/plain') {
-            results[resultIdx] = {
-              text: image.buffer.toString('utf-8'),
-              confidence: 0,
-              metadata: {
-                processingTime: 0,
-                provider: 'placeholder',
-              },
-            };
-            return;
-          }
-
-          results[resultIdx] = await this.extractText(image.buffer, image.contentType);
-        } catch (error) {
-          logger.warn('Batch OCR: Image processing failed', {
-            imageIndex: resultIdx,
-            error: error instanceof Error ? error.message : 'Unknown error',
-          });
-          // Continue with other images even if one fails
-          results[resultIdx] = {
-            text: '[OCR failed for this image]',
-            confidence: 0,
-            metadata: {
-              processingTime: 0,
-              provider: this.config.provider,
-              error: error instanceof Error ? error.message : 'Unknown error',
-            },
-          };
-        }
-      });
-
-      // Wait for current batch to complete before processing next batch
-      await Promise.all(batchPromises);
+    for await (const { index, result } of this.iterateTextBatch(images, options)) {
+      results[index] = result;
     }
 
     return results;
   }
 
+  /**
+   * Stream batch OCR results as each image completes
+   * Results arrive in completion order, tagged with their input index.
+   *
+   * Up to `concurrency` images are in flight at once; each finished image frees
+   * its slot for the next one, so one slow page does not hold back the rest.
+   * The next image only starts once the consumer has taken a result, so at most
+   * `concurrency` results are held in memory regardless of batch size.
+   *
+   * `images` may be an async iterable (e.g. PDF pages as they are rendered); it is
+   * only read when a slot is free, so producing images keeps pace with OCR.
+   */
+  async *iterateTextBatch(
+    images:
+      | Iterable<{ buffer: Buffer; contentType: string }>
+      | AsyncIterable<{ buffer: Buffer; contentType: string }>,
+    options: { concurrency?: number } = {}
+  ): AsyncGenerator<{ index: number; result: OCRResult }> {
+    const concurrency = options.concurrency || 3; // Process 3 images at a time by default
+    const source =
+      Symbol.asyncIterator in images
+        ? images[Symbol.asyncIterator]()
+        : images[Symbol.iterator]();
+    const inFlight = new Map<number, Promise<{ index: number; result: OCRResult }>>();
+    let nextIndex = 0;
+    let exhausted = false;
+
+    const startNext = async () => {
+      const next = await source.next();
+      if (next.done) {
+        exhausted = true;
+        return;
+      }
+
+      const index = nextIndex++;
+      inFlight.set(
+        index,
+        this.extractBatchItem(next.value, index).then((result) => ({ index, result }))
+      );
+    };
+
+    while (!exhausted && inFlight.size < concurrency) {
+      await startNext();
+    }
+
+    while (inFlight.size > 0) {
+      // extractBatchItem never rejects, so a race settles with the first finished image
+      const completed = await Promise.race(inFlight.values());
+      inFlight.delete(completed.index);
+      yield completed;
+
+      if (!exhausted) {
+        await startNext();
+      }
+    }
+  }
+
+  /**
+   * OCR a single batch image, turning failures into a placeholder result
+   * so the rest of the batch can continue
+   */
+  private async extractBatchItem(
+    image: { buffer: Buffer; contentType: string },
+    imageIndex: number
+  ): Promise<OCRResult> {
+    // Handle placeholder text content (from failed page conversions)
+    if (image.contentType === 'text/plain') {
+      return {
+        text: image.buffer.toString('utf-8'),
+        confidence: 0,
+        metadata: {
+          processingTime: 0,
+          provider: 'placeholder',
+        },
+      };
+    }
+
+    try {
+      return await this.extractText(image.buffer, image.contentType);
+    } catch (error) {
+      logger.warn('Batch OCR: Image processing failed', {
+        imageIndex,
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
+      return {
+        text: '[OCR failed for this image]',
+        confidence: 0,
+        metadata: {
+          processingTime: 0,
+          provider: this.config.provider,
+          error: error instanceof Error ? error.message : 'Unknown error',
+        },
+      };
+    }
+  }
+
+  /**
+   * Rough cost of OCRing a PDF with this service's model
+   */
+  estimatePdfCost(pageCount: number): number {
+    return estimateOCRCost(pageCount, this.config.model);
+  }
+
   /**
    * Check if OCR service is properly configured
    */
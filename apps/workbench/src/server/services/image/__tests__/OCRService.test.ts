@@ -0,0 +1,366 @@
+/**
+ * OCRService tests
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { OCRService } from '../OCRService';
+
+const mocks = vi.hoisted(() => ({
+  create: vi.fn(),
+  prepareForOCR: vi.fn(),
+  isBlankImage: vi.fn(),
+  clientKeys: [] as string[],
+}));
+
+// Mock logger
+vi.mock('../../../utils/logger', () => ({
+  logger: {
+    debug: vi.fn(),
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    isLevelEnabled: vi.fn(() => false),
+  },
+}));
+
+// Mock OpenAI client
+vi.mock('openai', () => ({
+  OpenAI: class {
+    chat = { completions: { create: mocks.create } };
+
+    constructor({ apiKey }: { apiKey: string }) {
+      mocks.clientKeys.push(apiKey);
+    }
+  },
+}));
+
+// Mock image processing (sharp is not needed to test the OCR flow)
+vi.mock('@artificer/document-converter', () => ({
+  ImageExtractor: class {
+    prepareForOCR = mocks.prepareForOCR;
+    isBlankImage = mocks.isBlankImage;
+  },
+  PdfExtractor: class {
+    getMetadata = vi.fn();
+  },
+}));
+
+vi.mock('pdf2pic', () => ({
+  fromBuffer: vi.fn(),
+}));
+
+// Pass calls straight through so failing tests cannot open the shared breaker
+vi.mock('../../../utils/CircuitBreaker', () => ({
+  circuitBreakerRegistry: {
+    getBreaker: () => ({ execute: <T>(fn: () => Promise<T>) => fn() }),
+  },
+}));
+
+function completion(text: string) {
+  return {
+    choices: [{ message: { content: text }, finish_reason: 'stop' }],
+    usage: { prompt_tokens: 1000, completion_tokens: 100, total_tokens: 1100 },
+  };
+}
+
+function deferred<T>() {
+  let resolve!: (value: T) => void;
+  let reject!: (error: Error) => void;
+  const promise = new Promise<T>((res, rej) => {
+    resolve = res;
+    reject = rej;
+  });
+  return { promise, resolve, reject };
+}
+
+describe('OCRService', () => {
+  let service: OCRService;
+
+  beforeEach(() => {
+    mocks.create.mockReset().mockResolvedValue(completion('Hello world'));
+    mocks.prepareForOCR
+      .mockReset()
+      .mockImplementation(async (buffer: Buffer, contentType: string) => ({
+        buffer,
+        contentType,
+        width: 1000,
+        height: 800,
+        isBlank: false,
+      }));
+    mocks.isBlankImage.mockReset().mockResolvedValue(false);
+
+    service = new OCRService({ provider: 'openai-vision', openaiApiKey: 'test-key' });
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  describe('configuration', () => {
+    it('should share one OpenAI client between services with the same API key', () => {
+      new OCRService({ provider: 'openai-vision', openaiApiKey: 'shared-key' });
+      new OCRService({ provider: 'openai-vision', openaiApiKey: 'shared-key' });
+      new OCRService({ provider: 'openai-vision', openaiApiKey: 'other-key' });
+
+      expect(mocks.clientKeys.filter((key) => key === 'shared-key')).toHaveLength(1);
+      expect(mocks.clientKeys.filter((key) => key === 'other-key')).toHaveLength(1);
+    });
+
+    it('should pass maxRetries through to the OpenAI SDK', async () => {
+      const noRetries = new OCRService({
+        provider: 'openai-vision',
+        openaiApiKey: 'test-key',
+        maxRetries: 0,
+      });
+
+      await service.extractText(Buffer.from('image-1'), 'image/png');
+      await noRetries.extractText(Buffer.from('image-2'), 'image/png');
+
+      expect(mocks.create.mock.calls[0][1].maxRetries).toBe(3);
+      expect(mocks.create.mock.calls[1][1].maxRetries).toBe(0);
+    });
+  });
+
+  describe('extractText', () => {
+    it('should extract text with OpenAI Vision', async () => {
+      const result = await service.extractText(Buffer.from('image'), 'image/png');
+
+      expect(result.text).toBe('Hello world');
+      expect(result.metadata.tokensUsed).toBe(1100);
+      expect(result.metadata.cost).toBeGreaterThan(0);
+      expect(mocks.create).toHaveBeenCalledTimes(1);
+    });
+
+    it('should return cached results at zero cost', async () => {
+      await service.extractText(Buffer.from('image'), 'image/png');
+      const result = await service.extractText(Buffer.from('image'), 'image/png');
+
+      expect(result.text).toBe('Hello world');
+      expect(result.metadata.cacheHit).toBe(true);
+      expect(result.metadata.tokensUsed).toBe(0);
+      expect(result.metadata.cost).toBe(0);
+      expect(mocks.create).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not share cached results between different images', async () => {
+      await service.extractText(Buffer.from('image-1'), 'image/png');
+      const result = await service.extractText(Buffer.from('image-2'), 'image/png');
+
+      expect(result.metadata.cacheHit).toBeUndefined();
+      expect(mocks.create).toHaveBeenCalledTimes(2);
+    });
+
+    it('should make one API call for concurrent identical images', async () => {
+      const response = deferred<ReturnType<typeof completion>>();
+      mocks.create.mockReturnValue(response.promise);
+
+      const first = service.extractText(Buffer.from('image'), 'image/png');
+      const second = service.extractText(Buffer.from('image'), 'image/png');
+      response.resolve(completion('Shared text'));
+
+      const [firstResult, secondResult] = await Promise.all([first, second]);
+
+      expect(mocks.create).toHaveBeenCalledTimes(1);
+      expect(firstResult.text).toBe('Shared text');
+      expect(firstResult.metadata.cost).toBeGreaterThan(0);
+      expect(secondResult.text).toBe('Shared text');
+      expect(secondResult.metadata.coalesced).toBe(true);
+      expect(secondResult.metadata.cost).toBe(0);
+    });
+
+    it('should reject every waiter when the shared call fails', async () => {
+      const response = deferred<ReturnType<typeof completion>>();
+      mocks.create.mockReturnValue(response.promise);
+
+      const first = service.extractText(Buffer.from('image'), 'image/png');
+      const second = service.extractText(Buffer.from('image'), 'image/png');
+      response.reject(new Error('Service unavailable'));
+
+      await expect(first).rejects.toThrow('Service unavailable');
+      await expect(second).rejects.toThrow('Service unavailable');
+      expect(mocks.create).toHaveBeenCalledTimes(1);
+
+      // The failed call is neither cached nor left in flight
+      mocks.create.mockResolvedValue(completion('Recovered'));
+      const retry = await service.extractText(Buffer.from('image'), 'image/png');
+
+      expect(retry.text).toBe('Recovered');
+      expect(mocks.create).toHaveBeenCalledTimes(2);
+    });
+
+    it('should skip the API for blank images', async () => {
+      mocks.prepareForOCR.mockImplementation(async (buffer: Buffer, contentType: string) => ({
+        buffer,
+        contentType,
+        width: 1000,
+        height: 800,
+        isBlank: true,
+      }));
+
+      const result = await service.extractText(Buffer.from('blank'), 'image/png');
+
+      expect(result.text).toBe('[No text found]');
+      expect(result.metadata.skippedBlank).toBe(true);
+      expect(result.metadata.cost).toBe(0);
+      expect(mocks.create).not.toHaveBeenCalled();
+    });
+
+    it('should check for blank images when resizing is disabled', async () => {
+      mocks.isBlankImage.mockResolvedValue(true);
+      const unresized = new OCRService({
+        provider: 'openai-vision',
+        openaiApiKey: 'test-key',
+        resizeImages: false,
+      });
+
+      const result = await unresized.extractText(Buffer.from('blank'), 'image/png');
+
+      expect(result.metadata.skippedBlank).toBe(true);
+      expect(mocks.prepareForOCR).not.toHaveBeenCalled();
+      expect(mocks.create).not.toHaveBeenCalled();
+    });
+
+    it('should send the original image when preparation fails', async () => {
+      mocks.prepareForOCR.mockRejectedValue(new Error('Unsupported image'));
+
+      const result = await service.extractText(Buffer.from('image'), 'image/png');
+
+      expect(result.text).toBe('Hello world');
+      const [params] = mocks.create.mock.calls[0];
+      expect(params.messages[0].content[1].image_url.url).toBe(
+        `data:image/png;base64,${Buffer.from('image').toString('base64')}`
+      );
+    });
+
+    it('should use low detail for images that fit in one tile', async () => {
+      mocks.prepareForOCR.mockImplementation(async (buffer: Buffer, contentType: string) => ({
+        buffer,
+        contentType,
+        width: 400,
+        height: 300,
+        isBlank: false,
+      }));
+
+      await service.extractText(Buffer.from('small'), 'image/png');
+
+      const [params] = mocks.create.mock.calls[0];
+      expect(params.messages[0].content[1].image_url.detail).toBe('low');
+    });
+
+    it('should abort the request on timeout', async () => {
+      vi.useFakeTimers();
+      let signal: AbortSignal | undefined;
+      mocks.create.mockImplementation(
+        (_params: unknown, options: { signal: AbortSignal }) =>
+          new Promise((_resolve, reject) => {
+            signal = options.signal;
+            signal.addEventListener('abort', () => reject(new Error('Request was aborted')));
+          })
+      );
+
+      const request = service.extractText(Buffer.from('image'), 'image/png');
+      const assertion = expect(request).rejects.toThrow('OpenAI API call timeout after 30s');
+      await vi.waitFor(() => expect(signal).toBeDefined());
+      await vi.advanceTimersByTimeAsync(30_000);
+      await assertion;
+
+      expect(signal?.aborted).toBe(true);
+      expect(vi.getTimerCount()).toBe(0);
+    });
+
+    it('should clear the timeout timer once the call completes', async () => {
+      vi.useFakeTimers();
+
+      await service.extractText(Buffer.from('image'), 'image/png');
+
+      const [, options] = mocks.create.mock.calls[0];
+      expect(options.signal.aborted).toBe(false);
+      expect(vi.getTimerCount()).toBe(0);
+    });
+  });
+
+  describe('extractTextBatch', () => {
+    it('should return results in input order with placeholders for failures', async () => {
+      mocks.create.mockImplementation(async (params: any) => {
+        const url: string = params.messages[0].content[1].image_url.url;
+        if (url.endsWith(Buffer.from('image-2').toString('base64'))) {
+          throw new Error('Bad image');
+        }
+        return completion(url.slice(-8));
+      });
+
+      const results = await service.extractTextBatch([
+        { buffer: Buffer.from('image-1'), contentType: 'image/png' },
+        { buffer: Buffer.from('image-2'), contentType: 'image/png' },
+        { buffer: Buffer.from('[Failed to extract page 3]'), contentType: 'text/plain' },
+      ]);
+
+      expect(results).toHaveLength(3);
+      expect(results[0].text).toBe(Buffer.from('image-1').toString('base64').slice(-8));
+      expect(results[1].text).toBe('[OCR failed for this image]');
+      expect(results[2].text).toBe('[Failed to extract page 3]');
+      expect(results[2].metadata.provider).toBe('placeholder');
+    });
+  });
+
+  describe('iterateTextBatch', () => {
+    it('should keep at most `concurrency` images in flight', async () => {
+      const responses = Array.from({ length: 4 }, () => deferred<ReturnType<typeof completion>>());
+      let calls = 0;
+      mocks.create.mockImplementation(() => responses[calls++].promise);
+
+      const images = Array.from({ length: 4 }, (_, i) => ({
+        buffer: Buffer.from(`image-${i}`),
+        contentType: 'image/png',
+      }));
+      const iterator = service.iterateTextBatch(images, { concurrency: 2 });
+
+      const firstResult = iterator.next();
+      await vi.waitFor(() => expect(mocks.create).toHaveBeenCalledTimes(2));
+
+      // The second image finishing first frees its slot for the third
+      responses[1].resolve(completion('second'));
+      expect((await firstResult).value).toMatchObject({ index: 1, result: { text: 'second' } });
+
+      const secondResult = iterator.next();
+      await vi.waitFor(() => expect(mocks.create).toHaveBeenCalledTimes(3));
+
+      responses[0].resolve(completion('first'));
+      expect((await secondResult).value).toMatchObject({ index: 0, result: { text: 'first' } });
+
+      responses[2].resolve(completion('third'));
+      responses[3].resolve(completion('fourth'));
+
+      const remaining = [];
+      for await (const item of iterator) {
+        remaining.push(item.index);
+      }
+      expect(remaining.sort()).toEqual([2, 3]);
+      expect(mocks.create).toHaveBeenCalledTimes(4);
+    });
+
+    it('should only read an async source when a slot is free', async () => {
+      let produced = 0;
+      async function* pages() {
+        for (let i = 0; i < 5; i++) {
+          produced++;
+          yield { buffer: Buffer.from(`page-${i}`), contentType: 'image/png' };
+        }
+      }
+
+      const iterator = service.iterateTextBatch(pages(), { concurrency: 2 });
+      const first = await iterator.next();
+
+      expect(first.done).toBe(false);
+      expect(produced).toBe(2);
+
+      const indices = [first.value!.index];
+      for await (const item of iterator) {
+        indices.push(item.index);
+      }
+
+      expect(indices.sort()).toEqual([0, 1, 2, 3, 4]);
+      expect(produced).toBe(5);
+    });
+  });
+});
@@ -44,17 +44,19 @@ export class ChunkingService {
     let chunkIndex = 0;
 
     while (startChar < content.length) {
-      const endChar = Math.min(startChar + this.chunkSize, content.length);
-      let chunkContent = content.slice(startChar, endChar);
+      let endChar = Math.min(startChar + this.chunkSize, content.length);
 
       // If not at the end, try to break at a natural boundary
       if (endChar < content.length) {
         const breakPoint = this.findBreakPoint(content, startChar, endChar);
         if (breakPoint > startChar) {
-          chunkContent = content.slice(startChar, breakPoint);
+          endChar = breakPoint;
         }
       }
 
+      // Slice once the boundary is settled, rather than slicing and re-slicing
+      const chunkContent = content.slice(startChar, endChar);
+
       // Create chunk
       chunks.push({
         id: `${documentId}_chunk_${chunkIndex}`,
@@ -66,18 +68,19 @@ export class ChunkingService {
           chunkIndex,
           totalChunks: 0, // Will be updated after all chunks are created
           startChar,
-          endChar: startChar + chunkContent.length,
+          endChar,
         },
       });
 
-      // Move to next chunk with overlap
-      startChar += chunkContent.length - this.chunkOverlap;
-      chunkIndex++;
-
-      // Prevent infinite loop
-      if (startChar + chunkContent.length >= content.length) {
+      // The chunk that reaches the end of the content is the last one
+      if (endChar >= content.length) {
         break;
       }
+
+      // Move to next chunk with overlap, always advancing even when a break
+      // point made this chunk shorter than the overlap
+      startChar = Math.max(startChar + 1, endChar - this.chunkOverlap);
+      chunkIndex++;
     }
 
     // Update total chunks count
@@ -93,11 +96,13 @@ export class ChunkingService {
    * Find a natural break point (separator) near the target position
    */
   private findBreakPoint(content: string, startChar: number, targetEnd: number): number {
+    // The search window is the same for every separator, so slice it once
+    const searchStart = Math.max(startChar, targetEnd - 200);
+    const searchContent = content.slice(searchStart, targetEnd);
+
     // Try each separator in order
     for (const separator of this.separators) {
       // Look backward from target for separator
-      const searchStart = Math.max(startChar, targetEnd - 200);
-      const searchContent = content.slice(searchStart, targetEnd);
       const lastIndex = searchContent.lastIndexOf(separator);
 
       if (lastIndex !== -1) {
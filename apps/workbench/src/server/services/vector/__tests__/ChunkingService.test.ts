@@ -14,6 +14,28 @@ describe('ChunkingService', () => {
       expect(chunks[0].metadata.totalChunks).toBe(chunks.length);
     });
 
+    it('should cover the end of the document', () => {
+      const service = new ChunkingService({ chunkSize: 100, chunkOverlap: 20 });
+
+      const content = 'A'.repeat(250);
+      const chunks = service.chunkDocument('doc-1', 'proj-1', content, 'test.md');
+
+      expect(chunks.map(chunk => [chunk.metadata.startChar, chunk.metadata.endChar])).toEqual([
+        [0, 100],
+        [80, 180],
+        [160, 250],
+      ]);
+    });
+
+    it('should cover the end of the document when chunks break early', () => {
+      const service = new ChunkingService({ chunkSize: 300, chunkOverlap: 50 });
+
+      const content = ('word '.repeat(20) + '\n\n').repeat(10);
+      const chunks = service.chunkDocument('doc-1', 'proj-1', content, 'test.md');
+
+      expect(chunks[chunks.length - 1].metadata.endChar).toBe(content.length);
+    });
+
     it('should handle small documents', () => {
       const service = new ChunkingService();
 
@@ -13,6 +13,7 @@ describe('Logger Class', () => {
       warn: vi.fn(),
       info: vi.fn(),
       debug: vi.fn(),
+      isLevelEnabled: vi.fn((level: string) => level !== 'debug'),
     } as unknown as pino.Logger;
 
     // Create a new Logger instance with the mock
@@ -47,6 +48,12 @@ describe('Logger Class', () => {
     expect(mockPinoInstance.debug).toHaveBeenCalledWith(meta, 'A debug message');
   });
 
+  it('should report enabled levels from pino', () => {
+    expect(logger.isLevelEnabled('info')).toBe(true);
+    expect(logger.isLevelEnabled('debug')).toBe(false);
+    expect(mockPinoInstance.isLevelEnabled).toHaveBeenCalledWith('debug');
+  });
+
   describe('Specialized Logging Methods', () => {
     it('apiRequest should call pino.info', () => {
       logger.apiRequest('GET', '/api/test', 100, 200, 'user-1');
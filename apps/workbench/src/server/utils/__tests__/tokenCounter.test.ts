@@ -47,6 +47,19 @@ describe('tokenCounter', () => {
       const count = countMessageTokens(content);
       expect(count).toBeGreaterThan(10);
     });
+
+    it('should count special-token markup as ordinary text', () => {
+      const count = countMessageTokens('Documents end with <|endoftext|> markers');
+      expect(count).toBeGreaterThan(5);
+    });
+
+    it('should return the same count for repeated content', () => {
+      const content = 'Repeated content is served from the token count cache.';
+      const first = countMessageTokens(content);
+
+      expect(countMessageTokens(content)).toBe(first);
+      expect(countMessageTokens(content, 'claude-3-5-sonnet')).toBe(first);
+    });
   });
 
   describe('countConversationTokens', () => {
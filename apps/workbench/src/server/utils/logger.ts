@@ -36,6 +36,14 @@ export class Logger {
     this.logger.debug(meta, message);
   }
 
+  /**
+   * Whether messages at `level` will be written
+   * Lets hot paths skip building log metadata that would be discarded.
+   */
+  isLevelEnabled(level: 'error' | 'warn' | 'info' | 'debug'): boolean {
+    return this.logger.isLevelEnabled(level);
+  }
+
   apiRequest(method: string, path: string, duration: number, status: number, userId?: string) {
     this.info('API Request', {
       request: { method, path, userId },
@@ -6,32 +6,108 @@
 import { encoding_for_model, Tiktoken, TiktokenModel } from 'tiktoken';
 import { logger } from './logger';
 
-// Cache encodings to avoid repeated initialization
+const MAX_TOKEN_COUNT_CACHE_SIZE = 1024; // Content token counts kept per encoding
+const MAX_CACHED_CONTENT_LENGTH = 16 * 1024; // Longer content is counted without being cached
+
+// Cache encodings to avoid repeated initialization, keyed by tiktoken model so that
+// every model id mapping to the same tiktoken model shares one loaded BPE table
 const encodingCache = new Map<string, Tiktoken>();
 
+// Model id -> its cached encoding, so repeat lookups skip the name mapping
+const modelEncodings = new Map<string, Tiktoken>();
+
 /**
  * Get or create cached encoding for a model
  */
 function getEncoding(model: string): Tiktoken {
-  if (encodingCache.has(model)) {
-    return encodingCache.get(model)!;
+  const cached = modelEncodings.get(model);
+  if (cached) {
+    return cached;
   }
 
-  try {
-    // Map common model names to tiktoken models
-    const tiktokenModel = mapToTiktokenModel(model);
-    const encoding = encoding_for_model(tiktokenModel);
-    encodingCache.set(model, encoding);
-    return encoding;
-  } catch (error) {
-    // Fallback to cl100k_base (used by GPT-4, Claude, etc.)
-    logger.warn(`Unknown model for tiktoken: ${model}, falling back to cl100k_base`);
-    if (!encodingCache.has('fallback')) {
-      const encoding = encoding_for_model('gpt-4');
-      encodingCache.set('fallback', encoding);
+  // Map common model names to tiktoken models
+  const tiktokenModel = mapToTiktokenModel(model);
+  let encoding = encodingCache.get(tiktokenModel);
+
+  if (!encoding) {
+    try {
+      encoding = encoding_for_model(tiktokenModel);
+      encodingCache.set(tiktokenModel, encoding);
+    } catch (error) {
+      // Fallback to cl100k_base (used by GPT-4, Claude, etc.)
+      logger.warn(`Unknown model for tiktoken: ${model}, falling back to cl100k_base`);
+      encoding = encodingCache.get('fallback');
+      if (!encoding) {
+        encoding = encoding_for_model('gpt-4');
+        encodingCache.set('fallback', encoding);
+      }
     }
-    return encodingCache.get('fallback')!;
   }
+
+  modelEncodings.set(model, encoding);
+  return encoding;
+}
+
+// Token counts of recently counted content per encoding (Map order tracks recency for LRU).
+// Conversation history is re-counted on every turn, so most messages are cache hits.
+const contentTokenCounts = new WeakMap<Tiktoken, Map<string, number>>();
+
+/**
+ * Count the tokens of message content, reusing the count for recently seen content
+ * Content is encoded as ordinary text: special-token markup such as <|endoftext|>
+ * in user content is counted like any other text instead of being rejected.
+ */
+function countContentTokens(encoding: Tiktoken, content: string): number {
+  if (content.length > MAX_CACHED_CONTENT_LENGTH) {
+    return encoding.encode_ordinary(content).length;
+  }
+
+  let counts = contentTokenCounts.get(encoding);
+  if (!counts) {
+    counts = new Map<string, number>();
+    contentTokenCounts.set(encoding, counts);
+  }
+
+  const cached = counts.get(content);
+  if (cached !== undefined) {
+    // LRU: Move to end (most recently used)
+    counts.delete(content);
+    counts.set(content, cached);
+    return cached;
+  }
+
+  const count = encoding.encode_ordinary(content).length;
+  if (counts.size >= MAX_TOKEN_COUNT_CACHE_SIZE) {
+    // Map maintains insertion order, so first key is least recently used
+    const firstKey = counts.keys().next().value;
+    if (firstKey !== undefined) {
+      counts.delete(firstKey);
+    }
+  }
+  counts.set(content, count);
+  return count;
+}
+
+// Token counts of message roles per encoding; roles come from a handful of values
+// ('user', 'assistant', 'system'), so each is only encoded once
+const roleTokenCounts = new WeakMap<Tiktoken, Map<string, number>>();
+
+/**
+ * Count the tokens of a message role, reusing earlier counts for the same encoding
+ */
+function countRoleTokens(encoding: Tiktoken, role: string): number {
+  let counts = roleTokenCounts.get(encoding);
+  if (!counts) {
+    counts = new Map<string, number>();
+    roleTokenCounts.set(encoding, counts);
+  }
+
+  let count = counts.get(role);
+  if (count === undefined) {
+    count = encoding.encode_ordinary(role).length;
+    counts.set(role, count);
+  }
+  return count;
 }
 
 /**
@@ -64,9 +140,7 @@ function mapToTiktokenModel(model: string): TiktokenModel {
  * Count tokens in a single message
  */
 export function countMessageTokens(content: string, model: string = 'gpt-4'): number {
-  const encoding = getEncoding(model);
-  const tokens = encoding.encode(content);
-  return tokens.length;
+  return countContentTokens(getEncoding(model), content);
 }
 
 /**
@@ -85,8 +159,8 @@ export function countConversationTokens(
   const messageOverhead = 4;
 
   for (const message of messages) {
-    const contentTokens = encoding.encode(message.content).length;
-    const roleTokens = encoding.encode(message.role).length;
+    const contentTokens = countContentTokens(encoding, message.content);
+    const roleTokens = countRoleTokens(encoding, message.role);
     totalTokens += contentTokens + roleTokens + messageOverhead;
   }
 
@@ -114,8 +188,8 @@ export function estimateMessageFit(
   // Count from the end (most recent messages)
   for (let i = messages.length - 1; i >= 0; i--) {
     const message = messages[i];
-    const contentTokens = encoding.encode(message.content).length;
-    const roleTokens = encoding.encode(message.role).length;
+    const contentTokens = countContentTokens(encoding, message.content);
+    const roleTokens = countRoleTokens(encoding, message.role);
     const messageTokens = contentTokens + roleTokens + messageOverhead;
 
     if (totalTokens + messageTokens > maxTokens) {
@@ -174,4 +248,5 @@ export function clearEncodingCache(): void {
     encoding.free();
   }
   encodingCache.clear();
+  modelEncodings.clear();
 }
@@ -105,6 +105,7 @@ vi.mock('./server/utils/logger', () => ({
     error: vi.fn(),
     warn: vi.fn(),
     debug: vi.fn(),
+    isLevelEnabled: vi.fn(() => true),
     rateLimitHit: vi.fn(),
     child: vi.fn(() => ({
       info: vi.fn(),
@@ -38,6 +38,23 @@ This is the content.`;
       expect(doc.metadata.tags).toContain('test');
     });
 
+    it('should not share parsed frontmatter between documents', async () => {
+      const markdown = `---
+title: Shared Template
+tags: [alpha, beta]
+---
+
+Body`;
+
+      const first = await converter.import(markdown);
+      (first.metadata.tags as string[]).push('mutated');
+
+      const second = await converter.import(markdown);
+
+      expect(second.metadata.title).toBe('Shared Template');
+      expect(second.metadata.tags).toEqual(['alpha', 'beta']);
+    });
+
     it('should export to markdown', async () => {
       const markdown = `# Test\n\nHello world`;
       const doc = await converter.import(markdown);
@@ -47,6 +64,19 @@ This is the content.`;
       expect(exported).toContain('Hello world');
     });
 
+    it('should keep link definitions on headings and paragraphs', async () => {
+      const markdown = `# See [the docs](https://example.com/docs)\n\nRead [this guide](https://example.com/guide) first.`;
+      const doc = await converter.import(markdown);
+
+      const [heading, paragraph] = doc.content as any[];
+      expect(heading.markDefs).toHaveLength(1);
+      expect(paragraph.markDefs[0]).toMatchObject({ _type: 'link', href: 'https://example.com/guide' });
+
+      const exported = await converter.export(doc, 'markdown');
+      expect(exported).toContain('# See [the docs](https://example.com/docs)');
+      expect(exported).toContain('[this guide](https://example.com/guide)');
+    });
+
     it('should round-trip markdown', async () => {
       const original = `# Title\n\nParagraph with **bold** and *italic* text.\n\n- List item 1\n- List item 2`;
       const doc = await converter.import(original);
@@ -104,6 +134,23 @@ This is the content.`;
       expect(parsed.results).toBeDefined();
     });
 
+    it('should nest deeper list items under their parent when exporting to Notion', async () => {
+      const markdown = `- One\n  - Two\n    - Three\n  - Four\n- Five\n\nAfter`;
+      const doc = await converter.import(markdown);
+      const exported = await converter.export(doc, 'notion');
+
+      const parsed = JSON.parse(exported);
+      const text = (block: any) => block[block.type].rich_text[0].plain_text;
+
+      expect(parsed.results.map(text)).toEqual(['One', 'Five', 'After']);
+
+      const one = parsed.results[0].bulleted_list_item;
+      expect(one.children.map(text)).toEqual(['Two', 'Four']);
+      expect(one.children[0].bulleted_list_item.children.map(text)).toEqual(['Three']);
+      expect(one.children[1].bulleted_list_item.children).toBeUndefined();
+      expect(parsed.results[1].bulleted_list_item.children).toBeUndefined();
+    });
+
     it('should handle extended Notion block types', async () => {
       const notionJson = JSON.stringify({
         object: 'page',
@@ -214,6 +261,15 @@ This is the content.`;
       expect(parsed.children).toBeDefined();
     });
 
+    it('should skip only the H1 matching the title when exporting to Roam', async () => {
+      const markdown = `# My **Page**\n\n# My Pa\n\nBody`;
+      const doc = await converter.import(markdown);
+      doc.metadata.title = 'My Page';
+
+      const parsed = JSON.parse(await converter.export(doc, 'roam'));
+      expect(parsed.children.map((child: any) => child.string)).toEqual(['My Pa', 'Body']);
+    });
+
     it('should handle Roam page references', async () => {
       const roamJson = JSON.stringify({
         title: 'Test',
@@ -0,0 +1,202 @@
+/**
+ * ImageExtractor tests
+ * sharp is mocked, so these cover the processing pipeline rather than pixel output
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { ImageExtractor } from '../extractors/image-extractor';
+
+const sharpMock = vi.hoisted(() => {
+  const state = {
+    metadata: { width: 1000, height: 800 } as { width: number; height: number },
+    stdev: 40,
+    min: 0,
+    max: 255,
+    error: undefined as Error | undefined,
+    instances: [] as any[],
+  };
+
+  const DOWNSCALED = { width: 2048, height: 1536, channels: 3 };
+
+  function createImage(input: unknown, options?: unknown) {
+    const image: any = { input, options };
+    for (const method of ['rotate', 'resize', 'flatten', 'raw', 'grayscale', 'normalise', 'jpeg']) {
+      image[method] = vi.fn(() => image);
+    }
+    image.metadata = vi.fn(async () => {
+      if (state.error) {
+        throw state.error;
+      }
+      return state.metadata;
+    });
+    image.stats = vi.fn(async () => {
+      const channel = { stdev: state.stdev, min: state.min, max: state.max };
+      return { channels: [channel, channel, channel] };
+    });
+    image.toBuffer = vi.fn(async () =>
+      image.raw.mock.calls.length > 0
+        ? { data: Buffer.from('raw pixels'), info: DOWNSCALED }
+        : { data: Buffer.from('jpeg'), info: { width: DOWNSCALED.width, height: DOWNSCALED.height } }
+    );
+    state.instances.push(image);
+    return image;
+  }
+
+  return { state, createImage, DOWNSCALED };
+});
+
+vi.mock('sharp', () => ({
+  default: vi.fn(sharpMock.createImage),
+}));
+
+describe('ImageExtractor', () => {
+  const extractor = new ImageExtractor();
+  const original = Buffer.from('original image');
+
+  beforeEach(() => {
+    sharpMock.state.metadata = { width: 1000, height: 800 };
+    sharpMock.state.stdev = 40;
+    sharpMock.state.min = 0;
+    sharpMock.state.max = 255;
+    sharpMock.state.error = undefined;
+    sharpMock.state.instances = [];
+  });
+
+  describe('isBlankImage', () => {
+    it('should detect a flat image as blank', async () => {
+      sharpMock.state.stdev = 0.5;
+      sharpMock.state.min = 250;
+
+      expect(await extractor.isBlankImage(original)).toBe(true);
+    });
+
+    it('should not treat an image with content as blank', async () => {
+      expect(await extractor.isBlankImage(original)).toBe(false);
+    });
+
+    it('should respect a custom threshold', async () => {
+      sharpMock.state.stdev = 5;
+      sharpMock.state.min = 240;
+
+      expect(await extractor.isBlankImage(original)).toBe(false);
+      expect(await extractor.isBlankImage(original, 10)).toBe(true);
+    });
+
+    it('should not treat a page with a short line of text as blank', async () => {
+      // A lone page number barely moves the deviation of a white page
+      sharpMock.state.stdev = 1.5;
+      sharpMock.state.min = 20;
+
+      expect(await extractor.isBlankImage(original)).toBe(false);
+    });
+  });
+
+  describe('prepareForOCR', () => {
+    it('should return small images untouched', async () => {
+      const result = await extractor.prepareForOCR(original, 'image/png');
+
+      expect(result).toEqual({
+        buffer: original,
+        contentType: 'image/png',
+        width: 1000,
+        height: 800,
+        isBlank: false,
+      });
+      expect(sharpMock.state.instances).toHaveLength(1);
+      expect(sharpMock.state.instances[0].jpeg).not.toHaveBeenCalled();
+    });
+
+    it('should flag small blank images', async () => {
+      sharpMock.state.stdev = 0;
+      sharpMock.state.min = 255;
+
+      const result = await extractor.prepareForOCR(original, 'image/png');
+
+      expect(result.isBlank).toBe(true);
+      expect(result.buffer).toBe(original);
+    });
+
+    it('should downscale before decoding large images to raw pixels', async () => {
+      sharpMock.state.metadata = { width: 8000, height: 6000 };
+
+      const result = await extractor.prepareForOCR(original, 'image/png');
+
+      const [decoder, analyzer, encoder] = sharpMock.state.instances;
+      expect(decoder.input).toBe(original);
+      expect(decoder.resize).toHaveBeenCalledWith(2048, 2048, {
+        fit: 'inside',
+        withoutEnlargement: true,
+      });
+      expect(decoder.resize.mock.invocationCallOrder[0]).toBeLessThan(
+        decoder.raw.mock.invocationCallOrder[0]
+      );
+
+      // The blank check and the encode both read the downscaled pixels
+      const rawInput = { raw: sharpMock.DOWNSCALED };
+      expect(analyzer.options).toEqual(rawInput);
+      expect(analyzer.stats).toHaveBeenCalled();
+      expect(encoder.options).toEqual(rawInput);
+      expect(encoder.resize).not.toHaveBeenCalled();
+      expect(encoder.jpeg).toHaveBeenCalledWith({ quality: 85 });
+
+      expect(result).toEqual({
+        buffer: Buffer.from('jpeg'),
+        contentType: 'image/jpeg',
+        width: 2048,
+        height: 1536,
+        isBlank: false,
+      });
+    });
+
+    it('should re-encode images over the byte limit', async () => {
+      const result = await extractor.prepareForOCR(original, 'image/png', { maxBytes: 4 });
+
+      expect(result.contentType).toBe('image/jpeg');
+    });
+
+    it('should return large blank images untouched without encoding them', async () => {
+      sharpMock.state.metadata = { width: 8000, height: 6000 };
+      sharpMock.state.stdev = 0;
+      sharpMock.state.min = 255;
+
+      const result = await extractor.prepareForOCR(original, 'image/png');
+
+      expect(result).toEqual({
+        buffer: original,
+        contentType: 'image/png',
+        width: 8000,
+        height: 6000,
+        isBlank: true,
+      });
+      expect(sharpMock.state.instances).toHaveLength(2);
+    });
+
+    it('should encode a large page with a short line of text instead of skipping it', async () => {
+      sharpMock.state.metadata = { width: 8000, height: 6000 };
+      sharpMock.state.stdev = 1.5;
+      sharpMock.state.min = 20;
+
+      const result = await extractor.prepareForOCR(original, 'image/png');
+
+      expect(result.isBlank).toBe(false);
+      expect(result.contentType).toBe('image/jpeg');
+    });
+
+    it('should convert to contrast-stretched grayscale when requested', async () => {
+      const result = await extractor.prepareForOCR(original, 'image/png', { grayscale: true });
+
+      const encoder = sharpMock.state.instances[2];
+      expect(encoder.grayscale).toHaveBeenCalled();
+      expect(encoder.normalise).toHaveBeenCalled();
+      expect(result.contentType).toBe('image/jpeg');
+    });
+
+    it('should wrap processing errors', async () => {
+      sharpMock.state.error = new Error('Input buffer contains unsupported image format');
+
+      await expect(extractor.prepareForOCR(original, 'image/png')).rejects.toThrow(
+        'Failed to prepare image for OCR: Input buffer contains unsupported image format'
+      );
+    });
+  });
+});
@@ -6,27 +6,41 @@ import type { PortableTextBlock, PortableTextSpan } from '@portabletext/types';
 import type { DocumentMetadata } from '../types/index';
 
 /**
- * Create a standard text block
+ * Create a block from pre-built spans
+ * All text blocks go through here so they share a single object shape
  */
-export function createTextBlock(
-  text: string,
+export function createBlock(
+  children: PortableTextSpan[],
   style: 'normal' | 'h1' | 'h2' | 'h3' | 'h4' | 'h5' | 'h6' | 'blockquote' = 'normal',
-  marks: string[] = []
+  markDefs: any[] = [],
+  listItem?: 'bullet' | 'number',
+  level: number = 1
 ): PortableTextBlock {
-  return {
+  const block: PortableTextBlock = {
     _type: 'block',
     _key: generateKey(),
     style,
-    children: [
-      {
-        _type: 'span',
-        _key: generateKey(),
-        text,
-        marks,
-      },
-    ],
-    markDefs: [],
+    children,
+    markDefs,
   };
+
+  if (listItem) {
+    block.listItem = listItem;
+    block.level = level;
+  }
+
+  return block;
+}
+
+/**
+ * Create a standard text block
+ */
+export function createTextBlock(
+  text: string,
+  style: 'normal' | 'h1' | 'h2' | 'h3' | 'h4' | 'h5' | 'h6' | 'blockquote' = 'normal',
+  marks: string[] = []
+): PortableTextBlock {
+  return createBlock([createSpan(text, marks)], style);
 }
 
 /**
@@ -86,22 +100,7 @@ export function createListItem(
   level: number = 1,
   listItem: 'bullet' | 'number' = 'bullet'
 ): PortableTextBlock {
-  return {
-    _type: 'block',
-    _key: generateKey(),
-    style: 'normal',
-    listItem,
-    level,
-    children: [
-      {
-        _type: 'span',
-        _key: generateKey(),
-        text,
-        marks: [],
-      },
-    ],
-    markDefs: [],
-  };
+  return createBlock([createSpan(text)], 'normal', [], listItem, level);
 }
 
 /**
@@ -139,11 +138,16 @@ export function createCalloutBlock(
   };
 }
 
+// Keys only need to be unique within a document, so a random per-process prefix plus a
+// counter is enough and avoids drawing from the RNG for every block and span
+const KEY_PREFIX = Math.random().toString(36).substring(2, 8).padEnd(6, '0');
+let keyCounter = 0;
+
 /**
  * Generate a unique key for Portable Text elements
  */
 export function generateKey(): string {
-  return Math.random().toString(36).substring(2, 15);
+  return KEY_PREFIX + (keyCounter++).toString(36);
 }
 
 /**
@@ -218,14 +222,15 @@ export function createMetadata(
   };
 }
 
+// Matches a CR (with an optional LF, allowing stray nulls in between) or a lone null byte
+const SANITIZE_PATTERN = /\r\u0000*\n?|\u0000/g;
+
 /**
  * Sanitize text for use in Portable Text
  */
 export function sanitizeText(text: string): string {
-  return text
-    .replace(/\u0000/g, '') // Remove null bytes
-    .replace(/\r\n/g, '\n') // Normalize line endings
-    .replace(/\r/g, '\n');
+  // Single scan: remove null bytes and normalize CRLF/CR line endings
+  return text.replace(SANITIZE_PATTERN, (match) => (match === '\u0000' ? '' : '\n'));
 }
 
 /**
@@ -9,6 +9,27 @@ import type {
 } from '../types/index';
 import type { PortableTextSpan } from '@portabletext/types';
 
+// Markdown delimiters for simple (non-annotation) marks
+const MARK_WRAPPERS = new Map<string, readonly [string, string]>([
+  ['strong', ['**', '**']],
+  ['em', ['*', '*']],
+  ['code', ['`', '`']],
+  ['strike', ['~~', '~~']],
+  ['underline', ['<u>', '</u>']],
+  ['highlight', ['==', '==']],
+]);
+
+// Well-known metadata fields, in the order they are written to frontmatter
+const FRONTMATTER_FIELDS: ReadonlyArray<readonly [string, (value: any) => string | undefined]> = [
+  ['title', (title) => `title: ${title}`],
+  ['tags', (tags) => (Array.isArray(tags) && tags.length > 0 ? `tags: ${tags.join(', ')}` : undefined)],
+  ['createdAt', (createdAt) => `created: ${createdAt}`],
+  ['updatedAt', (updatedAt) => `updated: ${updatedAt}`],
+];
+
+// Metadata keys that are either written above or internal to the converter
+const FRONTMATTER_SKIPPED_KEYS = new Set(['title', 'tags', 'createdAt', 'updatedAt', 'source', 'sourceId']);
+
 export class MarkdownExporter implements ExporterPlugin {
   name = 'markdown';
   targetFormat = 'markdown';
@@ -42,25 +63,19 @@ export class MarkdownExporter implements ExporterPlugin {
   private generateFrontmatter(metadata: Record<string, any>): string {
     const lines: string[] = ['---'];
 
-    if (metadata.title) {
-      lines.push(`title: ${metadata.title}`);
-    }
-
-    if (metadata.tags && Array.isArray(metadata.tags) && metadata.tags.length > 0) {
-      lines.push(`tags: ${metadata.tags.join(', ')}`);
-    }
-
-    if (metadata.createdAt) {
-      lines.push(`created: ${metadata.createdAt}`);
-    }
-
-    if (metadata.updatedAt) {
-      lines.push(`updated: ${metadata.updatedAt}`);
+    for (const [key, format] of FRONTMATTER_FIELDS) {
+      const value = metadata[key];
+      if (value) {
+        const line = format(value);
+        if (line) {
+          lines.push(line);
+        }
+      }
     }
 
     // Add other metadata fields
     for (const [key, value] of Object.entries(metadata)) {
-      if (!['title', 'tags', 'createdAt', 'updatedAt', 'source', 'sourceId'].includes(key)) {
+      if (!FRONTMATTER_SKIPPED_KEYS.has(key)) {
         lines.push(`${key}: ${value}`);
       }
     }
@@ -138,25 +153,9 @@ export class MarkdownExporter implements ExporterPlugin {
             }
           } else {
             // Simple text formatting
-            switch (mark) {
-              case 'strong':
-                text = `**${text}**`;
-                break;
-              case 'em':
-                text = `*${text}*`;
-                break;
-              case 'code':
-                text = `\`${text}\``;
-                break;
-              case 'strike':
-                text = `~~${text}~~`;
-                break;
-              case 'underline':
-                text = `<u>${text}</u>`;
-                break;
-              case 'highlight':
-                text = `==${text}==`;
-                break;
+            const wrapper = MARK_WRAPPERS.get(mark);
+            if (wrapper) {
+              text = wrapper[0] + text + wrapper[1];
             }
           }
         }
@@ -10,19 +10,113 @@ import type {
 } from '../types/index';
 import type { PortableTextSpan } from '@portabletext/types';
 
+// Portable Text decorator marks and the Notion annotation each one enables
+const SIMPLE_MARK_ANNOTATIONS = new Map<string, string>([
+  ['strong', 'bold'],
+  ['em', 'italic'],
+  ['strike', 'strikethrough'],
+  ['underline', 'underline'],
+  ['code', 'code'],
+]);
+
+// Heading style -> Notion block type, so the type string is not rebuilt for every heading
+const HEADING_TYPES = new Map<string, string>([
+  ['h1', 'heading_1'],
+  ['h2', 'heading_2'],
+  ['h3', 'heading_3'],
+  ['h4', 'heading_4'],
+  ['h5', 'heading_5'],
+  ['h6', 'heading_6'],
+]);
+
+// Callout type -> Notion icon emoji; unknown types fall back to the note emoji
+const CALLOUT_EMOJI = new Map<string, string>([
+  ['info', 'ℹ️'],
+  ['warning', '⚠️'],
+  ['error', '❌'],
+  ['success', '✅'],
+  ['note', '📝'],
+]);
+
+// Callout type -> Notion block color; unknown types fall back to gray
+const CALLOUT_COLORS = new Map<string, string>([
+  ['info', 'blue'],
+  ['warning', 'yellow'],
+  ['error', 'red'],
+  ['success', 'green'],
+  ['note', 'gray'],
+]);
+
+// Annotations for spans without marks, shared for the same reason as NO_CAPTION
+const NO_ANNOTATIONS = {
+  bold: false,
+  italic: false,
+  strikethrough: false,
+  underline: false,
+  code: false,
+} as const;
+
+// Default for missing children/markDefs/rows, which are only ever iterated
+const NO_ITEMS: readonly any[] = [];
+
+// Shared by every uncaptioned media block; converted blocks never leave export(),
+// which only serializes them, so the array is never mutated
+const NO_CAPTION: readonly any[] = [];
+
+/**
+ * Notion caption rich text for a media block; empty when there is no caption
+ */
+function captionRichText(caption: string | undefined): readonly any[] {
+  if (!caption) {
+    return NO_CAPTION;
+  }
+  return [
+    {
+      type: 'text',
+      text: { content: caption },
+      plain_text: caption,
+    },
+  ];
+}
+
 export class NotionExporter implements ExporterPlugin {
   name = 'notion';
   targetFormat = 'notion';
 
+  // Portable Text block _type -> converter, built once per exporter instead of
+  // switching over every type for each block
+  private readonly blockConverters: Map<string, (block: any, now: string) => any>;
+
+  constructor() {
+    this.blockConverters = new Map<string, (block: any, now: string) => any>([
+      ['block', this.convertTextBlock.bind(this)],
+      ['code', this.convertCodeBlock.bind(this)],
+      ['image', this.convertImageBlock.bind(this)],
+      ['table', this.convertTableBlock.bind(this)],
+      ['callout', this.convertCalloutBlock.bind(this)],
+      ['embed', this.convertEmbedBlock.bind(this)],
+      ['file', this.convertFileBlock.bind(this)],
+      ['video', this.convertVideoBlock.bind(this)],
+      ['audio', this.convertAudioBlock.bind(this)],
+      ['childPage', this.convertChildPageBlock.bind(this)],
+      ['tableOfContents', this.convertTableOfContentsBlock.bind(this)],
+      ['linkPreview', this.convertLinkPreviewBlock.bind(this)],
+    ]);
+  }
+
   async export(
     document: ConvertedDocument,
     options?: ExportOptions
   ): Promise<string> {
-    const blocks = this.convertBlocks(document.content);
+    // All blocks in one export share the same timestamp
+    const now = new Date().toISOString();
+
+    // convertBlocks only collects successfully converted blocks, so no null filtering is needed
+    const blocks = this.convertBlocks(document.content, now);
 
     const result = {
       object: 'list',
-      results: blocks.filter((b) => b !== null),
+      results: blocks,
       has_more: false,
       next_cursor: null,
     };
@@ -36,194 +130,194 @@ export class NotionExporter implements ExporterPlugin {
 
   /**
    * Convert blocks handling nested list structure
+   * Deeper list items become children of the closest shallower list item before them.
+   * Done in a single pass over a stack of open list items rather than re-scanning
+   * each item's child range recursively.
    */
-  private convertBlocks(blocks: any[], startIndex: number = 0, endIndex?: number): any[] {
+  private convertBlocks(blocks: any[], now: string): any[] {
     const result: any[] = [];
-    const end = endIndex ?? blocks.length;
-    let i = startIndex;
-
-    while (i < end) {
-      const block = blocks[i];
-
-      // Check if this is a list item with potential children
-      if (block.listItem && block.level) {
-        const converted = this.convertBlock(block);
+    // List items that can still receive children, shallowest first
+    const openItems: { level: number; converted: any }[] = [];
+
+    for (const block of blocks) {
+      if (!block.listItem || !block.level) {
+        // Any block that is not a nested list item ends all open lists
+        openItems.length = 0;
+        const converted = this.convertBlock(block, now);
         if (converted) {
-          // Look ahead for immediate children (level + 1)
-          let j = i + 1;
-          const childStartIndex = j;
+          result.push(converted);
+        }
+        continue;
+      }
 
-          // Find the range of all child blocks
-          while (j < end && blocks[j].listItem && blocks[j].level > block.level) {
-            j++;
-          }
+      // Close list items at the same depth or deeper than this one
+      while (openItems.length > 0 && openItems[openItems.length - 1].level >= block.level) {
+        openItems.pop();
+      }
 
-          // Recursively convert children if any exist
-          if (j > childStartIndex) {
-            const blockType = block.listItem === 'number' ? 'numbered_list_item' : 'bulleted_list_item';
-            converted[blockType].children = this.convertBlocks(blocks, childStartIndex, j);
-          }
+      const converted = this.convertBlock(block, now);
+      if (!converted) {
+        continue;
+      }
 
-          result.push(converted);
-          i = j;
-          continue;
+      const parent = openItems[openItems.length - 1];
+      if (parent) {
+        const parentContent = parent.converted[parent.converted.type];
+        if (!parentContent.children) {
+          parentContent.children = [];
         }
+        parentContent.children.push(converted);
       } else {
-        const converted = this.convertBlock(block);
-        if (converted) {
-          result.push(converted);
-        }
+        result.push(converted);
       }
 
-      i++;
+      openItems.push({ level: block.level, converted });
     }
 
     return result;
   }
 
-  private convertBlock(block: any): any {
-    const baseBlock = {
-      object: 'block',
-      type: '',
-      created_time: new Date().toISOString(),
-      last_edited_time: new Date().toISOString(),
-    };
-
-    switch (block._type) {
-      case 'block':
-        return this.convertTextBlock(block, baseBlock);
-      case 'code':
-        return this.convertCodeBlock(block, baseBlock);
-      case 'image':
-        return this.convertImageBlock(block, baseBlock);
-      case 'table':
-        return this.convertTableBlock(block, baseBlock);
-      case 'callout':
-        return this.convertCalloutBlock(block, baseBlock);
-      case 'embed':
-        return this.convertEmbedBlock(block, baseBlock);
-      case 'file':
-        return this.convertFileBlock(block, baseBlock);
-      case 'video':
-        return this.convertVideoBlock(block, baseBlock);
-      case 'audio':
-        return this.convertAudioBlock(block, baseBlock);
-      case 'childPage':
-        return this.convertChildPageBlock(block, baseBlock);
-      case 'tableOfContents':
-        return this.convertTableOfContentsBlock(block, baseBlock);
-      case 'linkPreview':
-        return this.convertLinkPreviewBlock(block, baseBlock);
-      default:
-        return null;
+  private convertBlock(block: any, now: string): any {
+    const convert = this.blockConverters.get(block._type);
+    if (!convert) {
+      return null;
     }
+
+    return convert(block, now);
   }
 
-  private convertTextBlock(block: any, baseBlock: any): any {
-    const richText = this.convertSpans(block.children || [], block.markDefs || []);
+  private convertTextBlock(block: any, now: string): any {
+    const { style, listItem } = block;
+    const richText = this.convertSpans(block.children || NO_ITEMS, block.markDefs || NO_ITEMS);
 
     // Determine block type
-    if (block.style?.startsWith('h')) {
-      const level = block.style.substring(1);
+    if (style?.startsWith('h')) {
+      const type = HEADING_TYPES.get(style) ?? `heading_${style.substring(1)}`;
       return {
-        ...baseBlock,
-        type: `heading_${level}`,
-        [`heading_${level}`]: { rich_text: richText },
+        object: 'block',
+        type,
+        created_time: now,
+        last_edited_time: now,
+        [type]: { rich_text: richText },
       };
     }
 
-    if (block.style === 'blockquote') {
+    if (style === 'blockquote') {
       return {
-        ...baseBlock,
+        object: 'block',
         type: 'quote',
+        created_time: now,
+        last_edited_time: now,
         quote: { rich_text: richText },
       };
     }
 
-    if (block.listItem) {
-      const type = block.listItem === 'number' ? 'numbered_list_item' : 'bulleted_list_item';
+    if (listItem) {
+      const type = listItem === 'number' ? 'numbered_list_item' : 'bulleted_list_item';
       return {
-        ...baseBlock,
+        object: 'block',
         type,
+        created_time: now,
+        last_edited_time: now,
         [type]: { rich_text: richText },
       };
     }
 
     // Regular paragraph
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'paragraph',
+      created_time: now,
+      last_edited_time: now,
       paragraph: { rich_text: richText },
     };
   }
 
   private convertSpans(spans: PortableTextSpan[], markDefs: any[]): any[] {
-    return spans.map((span) => {
-      if (!('text' in span)) {
-        return null;
+    // Index mark definitions once per block instead of scanning them for every mark;
+    // most blocks have none, so skip building the index for them
+    let markDefsByKey: Map<string, any> | undefined;
+    if (markDefs.length > 0) {
+      markDefsByKey = new Map<string, any>();
+      for (const def of markDefs) {
+        markDefsByKey.set(def._key, def);
       }
+    }
 
-      const annotations: any = {
-        bold: false,
-        italic: false,
-        strikethrough: false,
-        underline: false,
-        code: false,
-      };
-
-      let href: string | undefined;
-
-      // Process marks
-      for (const mark of span.marks || []) {
-        const markDef = markDefs.find((def) => def._key === mark);
-
-        if (markDef?._type === 'link') {
-          href = markDef.href;
-        } else {
-          switch (mark) {
-            case 'strong':
-              annotations.bold = true;
-              break;
-            case 'em':
-              annotations.italic = true;
-              break;
-            case 'strike':
-              annotations.strikethrough = true;
-              break;
-            case 'underline':
-              annotations.underline = true;
-              break;
-            case 'code':
-              annotations.code = true;
-              break;
-          }
-        }
+    const richText: any[] = [];
+    for (const span of spans) {
+      if ('text' in span) {
+        richText.push(this.buildRichText(span, markDefsByKey));
       }
+    }
+    return richText;
+  }
 
-      const richTextObject: any = {
+  /**
+   * Build the Notion rich text object for a single span
+   */
+  private buildRichText(span: PortableTextSpan, markDefsByKey: Map<string, any> | undefined): any {
+    // Plain text is the common case: no mark processing and no per-span annotations object
+    if (!span.marks || span.marks.length === 0) {
+      return {
         type: 'text',
         text: {
           content: span.text,
-          link: href ? { url: href } : null,
+          link: null,
         },
-        annotations,
+        annotations: NO_ANNOTATIONS,
         plain_text: span.text,
       };
+    }
+
+    const annotations: any = {
+      bold: false,
+      italic: false,
+      strikethrough: false,
+      underline: false,
+      code: false,
+    };
 
-      return richTextObject;
-    }).filter(Boolean);
+    let href: string | undefined;
+
+    // Process marks
+    for (const mark of span.marks) {
+      const markDef = markDefsByKey?.get(mark);
+
+      if (markDef?._type === 'link') {
+        href = markDef.href;
+      } else {
+        const annotation = SIMPLE_MARK_ANNOTATIONS.get(mark);
+        if (annotation) {
+          annotations[annotation] = true;
+        }
+      }
+    }
+
+    return {
+      type: 'text',
+      text: {
+        content: span.text,
+        link: href ? { url: href } : null,
+      },
+      annotations,
+      plain_text: span.text,
+    };
   }
 
-  private convertCodeBlock(block: any, baseBlock: any): any {
+  private convertCodeBlock(block: any, now: string): any {
+    const code = block.code || '';
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'code',
+      created_time: now,
+      last_edited_time: now,
       code: {
         rich_text: [
           {
             type: 'text',
-            text: { content: block.code || '' },
-            plain_text: block.code || '',
+            text: { content: code },
+            plain_text: code,
           },
         ],
         language: block.language || 'plain text',
@@ -231,36 +325,32 @@ export class NotionExporter implements ExporterPlugin {
     };
   }
 
-  private convertImageBlock(block: any, baseBlock: any): any {
+  private convertImageBlock(block: any, now: string): any {
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'image',
+      created_time: now,
+      last_edited_time: now,
       image: {
         type: 'external',
         external: { url: block.url || '' },
-        caption: block.caption
-          ? [
-              {
-                type: 'text',
-                text: { content: block.caption },
-                plain_text: block.caption,
-              },
-            ]
-          : [],
+        caption: captionRichText(block.caption),
       },
     };
   }
 
-  private convertTableBlock(block: any, baseBlock: any): any {
-    const rows = block.rows || [];
-    const width = rows[0]?.cells?.length || 0;
+  private convertTableBlock(block: any, now: string): any {
+    const rows = block.rows || NO_ITEMS;
+    const firstRow = rows[0];
 
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'table',
+      created_time: now,
+      last_edited_time: now,
       table: {
-        table_width: width,
-        has_column_header: rows[0]?.header || false,
+        table_width: firstRow?.cells?.length || 0,
+        has_column_header: firstRow?.header || false,
         has_row_header: false,
         children: rows.map((row: any) => ({
           object: 'block',
@@ -279,143 +369,115 @@ export class NotionExporter implements ExporterPlugin {
     };
   }
 
-  private convertCalloutBlock(block: any, baseBlock: any): any {
-    const richText = this.convertSpans(block.children || [], block.markDefs || []);
+  private convertCalloutBlock(block: any, now: string): any {
+    const { calloutType } = block;
+    const richText = this.convertSpans(block.children || NO_ITEMS, block.markDefs || NO_ITEMS);
 
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'callout',
+      created_time: now,
+      last_edited_time: now,
       callout: {
         rich_text: richText,
-        icon: { type: 'emoji', emoji: this.getCalloutEmoji(block.calloutType) },
-        color: this.getCalloutColor(block.calloutType),
+        icon: { type: 'emoji', emoji: CALLOUT_EMOJI.get(calloutType) ?? '📝' },
+        color: CALLOUT_COLORS.get(calloutType) ?? 'gray',
       },
     };
   }
 
-  private getCalloutEmoji(type: string): string {
-    const emojiMap: Record<string, string> = {
-      info: 'ℹ️',
-      warning: '⚠️',
-      error: '❌',
-      success: '✅',
-      note: '📝',
-    };
-    return emojiMap[type] || '📝';
-  }
-
-  private getCalloutColor(type: string): string {
-    const colorMap: Record<string, string> = {
-      info: 'blue',
-      warning: 'yellow',
-      error: 'red',
-      success: 'green',
-      note: 'gray',
-    };
-    return colorMap[type] || 'gray';
-  }
-
-  private convertEmbedBlock(block: any, baseBlock: any): any {
+  private convertEmbedBlock(block: any, now: string): any {
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'embed',
+      created_time: now,
+      last_edited_time: now,
       embed: {
         url: block.url || '',
       },
     };
   }
 
-  private convertFileBlock(block: any, baseBlock: any): any {
+  private convertFileBlock(block: any, now: string): any {
     const blockType = block.type === 'pdf' ? 'pdf' : 'file';
     return {
-      ...baseBlock,
+      object: 'block',
       type: blockType,
+      created_time: now,
+      last_edited_time: now,
       [blockType]: {
         type: 'external',
         external: {
           url: block.url || '',
         },
-        caption: block.caption
-          ? [
-              {
-                type: 'text',
-                text: { content: block.caption },
-                plain_text: block.caption,
-              },
-            ]
-          : [],
+        caption: captionRichText(block.caption),
       },
     };
   }
 
-  private convertVideoBlock(block: any, baseBlock: any): any {
+  private convertVideoBlock(block: any, now: string): any {
+    const provider = block.provider || 'external';
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'video',
+      created_time: now,
+      last_edited_time: now,
       video: {
-        type: block.provider || 'external',
-        [block.provider || 'external']: {
+        type: provider,
+        [provider]: {
           url: block.url || '',
         },
-        caption: block.caption
-          ? [
-              {
-                type: 'text',
-                text: { content: block.caption },
-                plain_text: block.caption,
-              },
-            ]
-          : [],
+        caption: captionRichText(block.caption),
       },
     };
   }
 
-  private convertAudioBlock(block: any, baseBlock: any): any {
+  private convertAudioBlock(block: any, now: string): any {
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'audio',
+      created_time: now,
+      last_edited_time: now,
       audio: {
         type: 'external',
         external: {
           url: block.url || '',
         },
-        caption: block.caption
-          ? [
-              {
-                type: 'text',
-                text: { content: block.caption },
-                plain_text: block.caption,
-              },
-            ]
-          : [],
+        caption: captionRichText(block.caption),
       },
     };
   }
 
-  private convertChildPageBlock(block: any, baseBlock: any): any {
+  private convertChildPageBlock(block: any, now: string): any {
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'child_page',
+      created_time: now,
+      last_edited_time: now,
       child_page: {
         title: block.title || 'Untitled',
       },
     };
   }
 
-  private convertTableOfContentsBlock(block: any, baseBlock: any): any {
+  private convertTableOfContentsBlock(block: any, now: string): any {
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'table_of_contents',
+      created_time: now,
+      last_edited_time: now,
       table_of_contents: {
         color: block.color || 'default',
       },
     };
   }
 
-  private convertLinkPreviewBlock(block: any, baseBlock: any): any {
+  private convertLinkPreviewBlock(block: any, now: string): any {
     return {
-      ...baseBlock,
+      object: 'block',
       type: 'link_preview',
+      created_time: now,
+      last_edited_time: now,
       link_preview: {
         url: block.url || '',
       },
@@ -9,6 +9,23 @@ import type {
 } from '../types/index';
 import type { PortableTextSpan } from '@portabletext/types';
 
+// Portable Text decorator marks and the Roam markup wrapped around each side of the text
+const MARK_DELIMITERS = new Map<string, string>([
+  ['strong', '**'],
+  ['em', '*'],
+  ['code', '`'],
+  ['strike', '~~'],
+  ['highlight', '^^'],
+]);
+
+const UID_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789';
+const UID_LENGTH = 9;
+const UID_RANDOM_POOL_SIZE = UID_LENGTH * 256; // Random bytes fetched per getRandomValues call
+
+// Random bytes shared by all exports; refilled in place once fewer than UID_LENGTH remain
+let uidRandomPool: Uint8Array | undefined;
+let uidRandomOffset = 0;
+
 export class RoamExporter implements ExporterPlugin {
   name = 'roam';
   targetFormat = 'roam';
@@ -18,12 +35,14 @@ export class RoamExporter implements ExporterPlugin {
     options?: ExportOptions
   ): Promise<string> {
     const title = document.metadata?.title || 'Untitled';
+    // Read the clock once; every exported block shares this timestamp
+    const now = Date.now();
     const createTime = document.metadata?.createdAt
       ? new Date(document.metadata.createdAt).getTime()
-      : Date.now();
+      : now;
     const editTime = document.metadata?.updatedAt
       ? new Date(document.metadata.updatedAt).getTime()
-      : Date.now();
+      : now;
 
     const children: any[] = [];
 
@@ -32,12 +51,12 @@ export class RoamExporter implements ExporterPlugin {
       if (
         block._type === 'block' &&
         (block as any).style === 'h1' &&
-        this.extractText(block) === title
+        this.blockTextEquals(block, title)
       ) {
         continue;
       }
 
-      const converted = this.convertBlock(block);
+      const converted = this.convertBlock(block, now);
       if (converted) {
         if (Array.isArray(converted)) {
           children.push(...converted);
@@ -61,28 +80,28 @@ export class RoamExporter implements ExporterPlugin {
     );
   }
 
-  private convertBlock(block: any): any | any[] | null {
+  private convertBlock(block: any, now: number): any | any[] | null {
     switch (block._type) {
       case 'block':
-        return this.convertTextBlock(block);
+        return this.convertTextBlock(block, now);
       case 'code':
-        return this.convertCodeBlock(block);
+        return this.convertCodeBlock(block, now);
       case 'image':
-        return this.convertImageBlock(block);
+        return this.convertImageBlock(block, now);
       case 'table':
-        return this.convertTableBlock(block);
+        return this.convertTableBlock(block, now);
       default:
         return null;
     }
   }
 
-  private convertTextBlock(block: any): any {
+  private convertTextBlock(block: any, now: number): any {
     const text = this.convertSpans(block.children || [], block.markDefs || []);
 
     const roamBlock: any = {
       string: text,
-      'create-time': Date.now(),
-      'edit-time': Date.now(),
+      'create-time': now,
+      'edit-time': now,
       uid: this.generateUid(),
     };
 
@@ -102,6 +121,12 @@ export class RoamExporter implements ExporterPlugin {
   }
 
   private convertSpans(spans: PortableTextSpan[], markDefs: any[]): string {
+    // Index mark definitions once per block instead of scanning them for every mark
+    const markDefsByKey = new Map<string, any>();
+    for (const def of markDefs) {
+      markDefsByKey.set(def._key, def);
+    }
+
     return spans
       .map((span) => {
         if (!('text' in span)) {
@@ -113,7 +138,7 @@ export class RoamExporter implements ExporterPlugin {
 
         // Apply marks
         for (const mark of marks) {
-          const markDef = markDefs.find((def) => def._key === mark);
+          const markDef = markDefsByKey.get(mark);
 
           if (markDef) {
             if (markDef._type === 'link') {
@@ -122,22 +147,9 @@ export class RoamExporter implements ExporterPlugin {
               text = `[[${markDef.target}]]`;
             }
           } else {
-            switch (mark) {
-              case 'strong':
-                text = `**${text}**`;
-                break;
-              case 'em':
-                text = `*${text}*`;
-                break;
-              case 'code':
-                text = `\`${text}\``;
-                break;
-              case 'strike':
-                text = `~~${text}~~`;
-                break;
-              case 'highlight':
-                text = `^^${text}^^`;
-                break;
+            const delimiter = MARK_DELIMITERS.get(mark);
+            if (delimiter) {
+              text = `${delimiter}${text}${delimiter}`;
             }
           }
         }
@@ -147,71 +159,82 @@ export class RoamExporter implements ExporterPlugin {
       .join('');
   }
 
-  private convertCodeBlock(block: any): any {
+  private convertCodeBlock(block: any, now: number): any {
     const code = block.code || '';
     const language = block.language || '';
 
     return {
       string: `\`\`\`${language}\n${code}\n\`\`\``,
-      'create-time': Date.now(),
-      'edit-time': Date.now(),
+      'create-time': now,
+      'edit-time': now,
       uid: this.generateUid(),
     };
   }
 
-  private convertImageBlock(block: any): any {
+  private convertImageBlock(block: any, now: number): any {
     const url = block.url || '';
     const alt = block.alt || '';
 
     return {
       string: `![${alt}](${url})`,
-      'create-time': Date.now(),
-      'edit-time': Date.now(),
+      'create-time': now,
+      'edit-time': now,
       uid: this.generateUid(),
     };
   }
 
-  private convertTableBlock(block: any): any[] {
+  private convertTableBlock(block: any, now: number): any[] {
     // Roam doesn't have native tables, so we'll represent as nested blocks
     const rows = block.rows || [];
     return rows.map((row: any) => ({
       string: row.cells.join(' | '),
-      'create-time': Date.now(),
-      'edit-time': Date.now(),
+      'create-time': now,
+      'edit-time': now,
       uid: this.generateUid(),
     }));
   }
 
-  private extractText(block: any): string {
-    if (block._type === 'block' && 'children' in block) {
-      return (block.children as any[])
-        .map((child) => {
-          if ('text' in child) {
-            return child.text;
-          }
-          return '';
-        })
-        .join('');
+  /**
+   * Check whether a text block's spans spell out `target`
+   * Compares span by span, so a mismatch stops at the first differing span
+   * instead of joining the whole block first.
+   */
+  private blockTextEquals(block: any, target: string): boolean {
+    let pos = 0;
+
+    for (const child of block.children || []) {
+      if (!('text' in child)) {
+        continue;
+      }
+
+      const text: string = child.text ?? '';
+      if (!target.startsWith(text, pos)) {
+        return false;
+      }
+      pos += text.length;
     }
-    return '';
+
+    return pos === target.length;
   }
 
   private generateUid(): string {
     // Generate a Roam-style UID (9 characters) using crypto for better randomness
-    const chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789';
     let uid = '';
 
     // Use crypto.getRandomValues for cryptographically strong random values
-    const randomValues = new Uint8Array(9);
     if (typeof crypto !== 'undefined' && crypto.getRandomValues) {
-      crypto.getRandomValues(randomValues);
-      for (let i = 0; i < 9; i++) {
-        uid += chars.charAt(randomValues[i] % chars.length);
+      // Draw from a shared pool so a large export makes one call per 256 UIDs
+      if (!uidRandomPool || uidRandomOffset + UID_LENGTH > uidRandomPool.length) {
+        uidRandomPool = crypto.getRandomValues(uidRandomPool || new Uint8Array(UID_RANDOM_POOL_SIZE));
+        uidRandomOffset = 0;
+      }
+      for (let i = 0; i < UID_LENGTH; i++) {
+        uid += UID_CHARS.charAt(uidRandomPool[uidRandomOffset++] % UID_CHARS.length);
       }
     } else {
       // Fallback for environments without crypto.getRandomValues
-      for (let i = 0; i < 9; i++) {
-        uid += chars.charAt(Math.floor(Math.random() * chars.length));
+      for (let i = 0; i < UID_LENGTH; i++) {
+        uid += UID_CHARS.charAt(Math.floor(Math.random() * UID_CHARS.length));
       }
     }
 
@@ -3,9 +3,45 @@
  * Extracts technical metadata from images without OCR
  */
 
-import sharp from 'sharp';
+import type sharpType from 'sharp';
 import type { ImageMetadata } from '../types/pdf';
 
+type SharpFactory = typeof sharpType;
+
+// sharp loads libvips natively; defer it until an image is actually processed
+// so importing the converter (which re-exports this class) stays cheap
+let sharpLoader: Promise<SharpFactory> | undefined;
+
+function loadSharp(): Promise<SharpFactory> {
+  if (!sharpLoader) {
+    sharpLoader = import('sharp').then(
+      (sharpModule) => ((sharpModule as any).default || sharpModule) as SharpFactory,
+      (error) => {
+        sharpLoader = undefined;
+        throw error;
+      }
+    );
+  }
+  return sharpLoader;
+}
+
+// Widest darkest-to-lightest spread (0-255) a blank image may have. A lone page
+// number or signature barely moves the standard deviation of a whole page, but
+// its ink still spans far more than this.
+const MAX_BLANK_RANGE = 32;
+
+/**
+ * True when every channel is flat enough for the image to count as blank
+ */
+function hasFlatChannels(
+  channels: Array<{ stdev: number; min: number; max: number }>,
+  maxStdev: number
+): boolean {
+  return channels.every(
+    (channel) => channel.stdev <= maxStdev && channel.max - channel.min <= MAX_BLANK_RANGE
+  );
+}
+
 export class ImageExtractor {
   /**
    * Extract metadata from image buffer
@@ -13,6 +49,7 @@ export class ImageExtractor {
    */
   async extractMetadata(buffer: Buffer): Promise<ImageMetadata> {
     try {
+      const sharp = await loadSharp();
       const image = sharp(buffer);
       const metadata = await image.metadata();
 
@@ -35,6 +72,111 @@ export class ImageExtractor {
     }
   }
 
+  /**
+   * Check whether an image is a single flat color, such as a blank scanned page
+   * An image counts as blank when every channel's standard deviation (0-255 scale)
+   * is at most `maxStdev` and no pixel stands out from the rest, so a page with
+   * only a short line of text on it is never treated as blank.
+   */
+  async isBlankImage(buffer: Buffer, maxStdev = 2): Promise<boolean> {
+    try {
+      const sharp = await loadSharp();
+      const { channels } = await sharp(buffer).stats();
+      return hasFlatChannels(channels, maxStdev);
+    } catch (error) {
+      throw new Error(
+        `Failed to analyze image: ${error instanceof Error ? error.message : 'Unknown error'}`
+      );
+    }
+  }
+
+  /**
+   * Blank check and upload preparation for OCR in one pass
+   * Images larger than `maxSide` on either side, or bigger than `maxBytes`, are
+   * downscaled to fit within `maxSide` and re-encoded as JPEG; anything else is
+   * returned untouched. Transparent areas are flattened onto white.
+   *
+   * With `grayscale`, every image is re-encoded as a contrast-stretched grayscale
+   * JPEG, which suits text-only OCR of scans: it drops the color channels and
+   * lifts faint print off a grey or yellowed background.
+   *
+   * An image that needs re-encoding is decoded once, already downscaled, and the
+   * blank check and JPEG encode both work from those pixels. Blank images are
+   * returned untouched.
+   */
+  async prepareForOCR(
+    buffer: Buffer,
+    contentType: string,
+    options: {
+      maxSide?: number;
+      maxBytes?: number;
+      quality?: number;
+      grayscale?: boolean;
+      maxStdev?: number;
+    } = {}
+  ): Promise<{
+    buffer: Buffer;
+    contentType: string;
+    width: number;
+    height: number;
+    isBlank: boolean;
+  }> {
+    const {
+      maxSide = 2048,
+      maxBytes = 500_000,
+      quality = 85,
+      grayscale = false,
+      maxStdev = 2,
+    } = options;
+
+    try {
+      const sharp = await loadSharp();
+      const image = sharp(buffer);
+      const { width = 0, height = 0 } = await image.metadata();
+
+      if (!grayscale && width <= maxSide && height <= maxSide && buffer.length <= maxBytes) {
+        const { channels } = await image.stats();
+        return { buffer, contentType, width, height, isBlank: hasFlatChannels(channels, maxStdev) };
+      }
+
+      // Resizing from the encoded input lets libvips shrink on load, so the raw
+      // pixels held here are at most maxSide x maxSide, never the full original
+      const { data: pixels, info: decoded } = await image
+        .rotate() // Apply EXIF orientation before the EXIF data is dropped
+        .resize(maxSide, maxSide, { fit: 'inside', withoutEnlargement: true })
+        .flatten({ background: '#ffffff' })
+        .raw()
+        .toBuffer({ resolveWithObject: true });
+      const rawInput = {
+        raw: { width: decoded.width, height: decoded.height, channels: decoded.channels },
+      };
+
+      const { channels } = await sharp(pixels, rawInput).stats();
+      if (hasFlatChannels(channels, maxStdev)) {
+        return { buffer, contentType, width, height, isBlank: true };
+      }
+
+      const encoder = sharp(pixels, rawInput);
+      if (grayscale) {
+        encoder.grayscale().normalise();
+      }
+
+      const { data, info } = await encoder.jpeg({ quality }).toBuffer({ resolveWithObject: true });
+
+      return {
+        buffer: data,
+        contentType: 'image/jpeg',
+        width: info.width,
+        height: info.height,
+        isBlank: false,
+      };
+    } catch (error) {
+      throw new Error(
+        `Failed to prepare image for OCR: ${error instanceof Error ? error.message : 'Unknown error'}`
+      );
+    }
+  }
+
   /**
    * Check if image format is supported
    */
@@ -59,6 +201,7 @@ export class ImageExtractor {
    */
   async isValidImage(buffer: Buffer): Promise<boolean> {
     try {
+      const sharp = await loadSharp();
       const image = sharp(buffer);
       await image.metadata();
       return true;
@@ -82,6 +225,7 @@ export class ImageExtractor {
     const { width = 200, height = 200, fit = 'cover' } = options;
 
     try {
+      const sharp = await loadSharp();
       return await sharp(buffer).resize(width, height, { fit }).toBuffer();
     } catch (error) {
       throw new Error(
@@ -99,6 +243,7 @@ export class ImageExtractor {
     quality = 85
   ): Promise<Buffer> {
     try {
+      const sharp = await loadSharp();
       const image = sharp(buffer);
 
       switch (contentType) {
@@ -128,6 +273,7 @@ export class ImageExtractor {
     targetFormat: 'jpeg' | 'png' | 'webp' | 'avif'
   ): Promise<Buffer> {
     try {
+      const sharp = await loadSharp();
       const image = sharp(buffer);
 
       switch (targetFormat) {
@@ -11,7 +11,18 @@ type PdfParseResult = {
   info?: Record<string, any>;
   text: string;
 };
-type PdfParseFunction = (buffer: Buffer) => Promise<PdfParseResult>;
+type PdfParseOptions = {
+  max?: number; // Pages to render text for (0 = all)
+  pagerender?: (pageData: unknown) => Promise<string>;
+};
+type PdfParseFunction = (buffer: Buffer, options?: PdfParseOptions) => Promise<PdfParseResult>;
+
+// Page count and document info are read before any page is rendered, so
+// metadata-only callers render one page and skip its text extraction
+const METADATA_ONLY_OPTIONS: PdfParseOptions = {
+  max: 1,
+  pagerender: () => Promise.resolve(''),
+};
 
 export class PdfExtractor {
   /**
@@ -20,22 +31,8 @@ export class PdfExtractor {
    */
   async extractText(buffer: Buffer): Promise<PdfExtractionResult> {
     try {
-      // Use dynamic import to handle ESM/CJS compatibility
-      const pdfParseModule = await import('pdf-parse');
-      const pdfParse = ((pdfParseModule as any).default || pdfParseModule) as unknown as PdfParseFunction;
-      const data = await pdfParse(buffer);
-
-      // Parse metadata
-      const metadata: PdfMetadata = {
-        title: data.info?.Title,
-        author: data.info?.Author,
-        subject: data.info?.Subject,
-        keywords: data.info?.Keywords,
-        creator: data.info?.Creator,
-        producer: data.info?.Producer,
-        creationDate: this.parseDate(data.info?.CreationDate),
-        modificationDate: this.parseDate(data.info?.ModDate),
-      };
+      const data = await this.parsePdf(buffer);
+      const metadata = this.parseMetadata(data.info);
 
       const text = data.text || '';
       const hasTextContent = text.trim().length > 100;
@@ -53,6 +50,32 @@ export class PdfExtractor {
     }
   }
 
+  /**
+   * Run pdf-parse on a buffer
+   */
+  private async parsePdf(buffer: Buffer, options?: PdfParseOptions): Promise<PdfParseResult> {
+    // Use dynamic import to handle ESM/CJS compatibility
+    const pdfParseModule = await import('pdf-parse');
+    const pdfParse = ((pdfParseModule as any).default || pdfParseModule) as unknown as PdfParseFunction;
+    return pdfParse(buffer, options);
+  }
+
+  /**
+   * Map the PDF info dictionary to PdfMetadata
+   */
+  private parseMetadata(info?: Record<string, any>): PdfMetadata {
+    return {
+      title: info?.Title,
+      author: info?.Author,
+      subject: info?.Subject,
+      keywords: info?.Keywords,
+      creator: info?.Creator,
+      producer: info?.Producer,
+      creationDate: this.parseDate(info?.CreationDate),
+      modificationDate: this.parseDate(info?.ModDate),
+    };
+  }
+
   /**
    * Determine if PDF needs OCR
    * Returns true if PDF appears to be scanned or has minimal text
@@ -93,13 +116,19 @@ export class PdfExtractor {
 
   /**
    * Get basic PDF information without full text extraction
-   * Useful for quick metadata checks
+   * Useful for quick metadata checks; page text is never extracted.
    */
   async getMetadata(buffer: Buffer): Promise<PdfMetadata & { pages: number }> {
-    const result = await this.extractText(buffer);
-    return {
-      ...result.metadata,
-      pages: result.pages,
-    };
+    try {
+      const data = await this.parsePdf(buffer, METADATA_ONLY_OPTIONS);
+      return {
+        ...this.parseMetadata(data.info),
+        pages: data.numpages || 0,
+      };
+    } catch (error) {
+      throw new Error(
+        `Failed to read PDF metadata: ${error instanceof Error ? error.message : 'Unknown error'}`
+      );
+    }
   }
 }
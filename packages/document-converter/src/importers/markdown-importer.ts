@@ -6,7 +6,6 @@ import { unified } from 'unified';
 import remarkParse from 'remark-parse';
 import remarkGfm from 'remark-gfm';
 import remarkFrontmatter from 'remark-frontmatter';
-import { visit } from 'unist-util-visit';
 import YAML from 'yaml';
 import type { Root, Content, PhrasingContent, Text } from 'mdast';
 import type {
@@ -16,6 +15,7 @@ import type {
   ObsidianFrontmatter,
 } from '../types/index';
 import {
+  createBlock,
   createTextBlock,
   createSpan,
   createCodeBlock,
@@ -28,6 +28,57 @@ import {
 } from '../core/portable-text-utils';
 import type { PortableTextBlock, PortableTextSpan } from '@portabletext/types';
 
+// Build the remark pipeline once; a frozen processor is reusable across parses
+const markdownProcessor = unified()
+  .use(remarkParse)
+  .use(remarkGfm)
+  .use(remarkFrontmatter, ['yaml'])
+  .freeze();
+
+// Obsidian callout opener at the start of a paragraph: [!type] text
+const CALLOUT_PATTERN = /^\[!(note|info|warning|error|success)\]\s*(.*)$/;
+
+// Obsidian wiki links: [[Page Name]] or [[Page Name|Alias]]
+const WIKI_LINK_PATTERN = /\[\[([^\]|]+)(?:\|([^\]]+))?\]\]/g;
+
+/**
+ * Normalize a frontmatter tags value to an array of strings
+ */
+function normalizeTags(tags: unknown): unknown {
+  if (typeof tags === 'string') {
+    return tags.split(',').map((t) => t.trim()).filter(Boolean);
+  }
+  return Array.isArray(tags) ? tags : [String(tags)];
+}
+
+// Per-field normalizers applied to parsed frontmatter
+const FRONTMATTER_NORMALIZERS: ReadonlyArray<readonly [string, (value: unknown) => unknown]> = [
+  ['tags', normalizeTags],
+];
+
+// Notes in a vault usually share a handful of frontmatter templates, so memoize the YAML parse
+const FRONTMATTER_CACHE_SIZE = 256;
+const frontmatterCache = new Map<string, unknown>();
+
+/**
+ * Parse a frontmatter YAML string, reusing earlier parses of identical source
+ * Returns a copy so callers can normalize/mutate the result freely
+ */
+function parseFrontmatterYaml(source: string): unknown {
+  let parsed = frontmatterCache.get(source);
+
+  if (parsed === undefined) {
+    parsed = YAML.parse(source);
+    if (frontmatterCache.size >= FRONTMATTER_CACHE_SIZE) {
+      // Evict the oldest entry (Map preserves insertion order)
+      frontmatterCache.delete(frontmatterCache.keys().next().value as string);
+    }
+    frontmatterCache.set(source, parsed);
+  }
+
+  return parsed !== null && typeof parsed === 'object' ? structuredClone(parsed) : parsed;
+}
+
 export class MarkdownImporter implements ImporterPlugin {
   name = 'markdown';
   supportedFormats = ['md', 'markdown', 'mdx'];
@@ -63,13 +114,8 @@ export class MarkdownImporter implements ImporterPlugin {
     const sanitized = sanitizeText(input);
 
     // Parse markdown to AST
-    const processor = unified()
-      .use(remarkParse)
-      .use(remarkGfm)
-      .use(remarkFrontmatter, ['yaml']);
-
-    const ast = processor.parse(sanitized);
-    const tree = processor.runSync(ast) as Root;
+    const ast = markdownProcessor.parse(sanitized);
+    const tree = markdownProcessor.runSync(ast) as Root;
 
     // Extract frontmatter
     const frontmatter = this.extractFrontmatter(tree);
@@ -134,20 +180,23 @@ export class MarkdownImporter implements ImporterPlugin {
   private extractFrontmatter(tree: Root): Partial<ObsidianFrontmatter> {
     let frontmatter: Partial<ObsidianFrontmatter> = {};
 
-    visit(tree, 'yaml', (node: any) => {
+    // remark-frontmatter only emits yaml nodes as top-level children,
+    // so there is no need to walk the whole tree
+    for (const node of tree.children) {
+      if (node.type !== 'yaml') {
+        continue;
+      }
+
       try {
-        const parsed = YAML.parse(node.value);
+        const parsed = parseFrontmatterYaml(node.value);
         if (parsed && typeof parsed === 'object') {
           // Merge parsed YAML into frontmatter
           Object.assign(frontmatter, parsed);
 
-          // Normalize tags to array format
-          if (frontmatter.tags !== undefined) {
-            const tags: unknown = frontmatter.tags;
-            if (typeof tags === 'string') {
-              frontmatter.tags = tags.split(',').map((t: string) => t.trim()).filter(Boolean);
-            } else if (!Array.isArray(tags)) {
-              frontmatter.tags = [String(tags)];
+          // Normalize known fields (e.g. tags to array format)
+          for (const [field, normalize] of FRONTMATTER_NORMALIZERS) {
+            if (frontmatter[field] !== undefined) {
+              frontmatter[field] = normalize(frontmatter[field]);
             }
           }
         }
@@ -155,7 +204,7 @@ export class MarkdownImporter implements ImporterPlugin {
         // Ignore frontmatter parsing errors but log for debugging
         console.warn('Failed to parse YAML frontmatter:', error);
       }
-    });
+    }
 
     return frontmatter;
   }
@@ -203,28 +252,20 @@ export class MarkdownImporter implements ImporterPlugin {
 
   private convertHeading(node: any): PortableTextBlock {
     const style = `h${node.depth}` as 'h1' | 'h2' | 'h3' | 'h4' | 'h5' | 'h6';
-    const children = this.convertInlineNodes(node.children);
-    const key = generateKey();
+    const markDefs: any[] = [];
+    const children = this.convertInlineNodes(node.children, markDefs);
+    const block = createBlock(children, style, markDefs);
 
-    this.recordSourceMap(key, node);
+    this.recordSourceMap(block._key, node);
 
-    return {
-      _type: 'block',
-      _key: key,
-      style,
-      children,
-      markDefs: [],
-    };
+    return block;
   }
 
   private convertParagraph(node: any): PortableTextBlock {
     // Check for Obsidian callouts
     const firstChild = node.children[0];
-    if (
-      firstChild?.type === 'text' &&
-      firstChild.value.match(/^\[!(note|info|warning|error|success)\]/)
-    ) {
-      const match = firstChild.value.match(/^\[!(note|info|warning|error|success)\]\s*(.*)$/);
+    if (firstChild?.type === 'text' && firstChild.value.startsWith('[!')) {
+      const match = CALLOUT_PATTERN.exec(firstChild.value);
       if (match) {
         const [, type, text] = match;
         const block = createCalloutBlock(
@@ -236,18 +277,13 @@ export class MarkdownImporter implements ImporterPlugin {
       }
     }
 
-    const children = this.convertInlineNodes(node.children);
-    const key = generateKey();
+    const markDefs: any[] = [];
+    const children = this.convertInlineNodes(node.children, markDefs);
+    const block = createBlock(children, 'normal', markDefs);
 
-    this.recordSourceMap(key, node);
+    this.recordSourceMap(block._key, node);
 
-    return {
-      _type: 'block',
-      _key: key,
-      style: 'normal',
-      children,
-      markDefs: [],
-    };
+    return block;
   }
 
   private convertCode(node: any): PortableTextBlock {
@@ -262,45 +298,37 @@ export class MarkdownImporter implements ImporterPlugin {
 
     for (const item of node.children) {
       if (item.type === 'listItem') {
-        blocks.push(...this.convertListItem(item, listType, 1));
+        this.convertListItem(item, listType, 1, blocks);
       }
     }
 
     return blocks;
   }
 
+  /**
+   * Append the blocks for a list item (and any nested lists) to `blocks`
+   */
   private convertListItem(
     node: any,
     listType: 'bullet' | 'number',
-    level: number
-  ): PortableTextBlock[] {
-    const blocks: PortableTextBlock[] = [];
-
+    level: number,
+    blocks: PortableTextBlock[]
+  ): void {
     for (const child of node.children) {
       if (child.type === 'paragraph') {
         const markDefs: any[] = [];
         const children = this.convertInlineNodes(child.children, markDefs);
-        blocks.push({
-          _type: 'block',
-          _key: generateKey(),
-          style: 'normal',
-          listItem: listType,
-          level,
-          children,
-          markDefs,
-        });
+        blocks.push(createBlock(children, 'normal', markDefs, listType, level));
       } else if (child.type === 'list') {
         // Nested list
         const nestedType = child.ordered ? 'number' : 'bullet';
         for (const nestedItem of child.children) {
           if (nestedItem.type === 'listItem') {
-            blocks.push(...this.convertListItem(nestedItem, nestedType, level + 1));
+            this.convertListItem(nestedItem, nestedType, level + 1, blocks);
           }
         }
       }
     }
-
-    return blocks;
   }
 
   private convertBlockquote(node: any): PortableTextBlock[] {
@@ -310,13 +338,7 @@ export class MarkdownImporter implements ImporterPlugin {
       if (child.type === 'paragraph') {
         const markDefs: any[] = [];
         const children = this.convertInlineNodes(child.children, markDefs);
-        blocks.push({
-          _type: 'block',
-          _key: generateKey(),
-          style: 'blockquote',
-          children,
-          markDefs,
-        });
+        blocks.push(createBlock(children, 'blockquote', markDefs));
       }
     }
 
@@ -338,17 +360,21 @@ export class MarkdownImporter implements ImporterPlugin {
     return createImageBlock(node.url, node.alt, node.title);
   }
 
-  private convertInlineNodes(nodes: PhrasingContent[], markDefs: any[] = []): PortableTextSpan[] {
+  private convertInlineNodes(nodes: PhrasingContent[], markDefs: any[]): PortableTextSpan[] {
     const spans: PortableTextSpan[] = [];
 
     for (const node of nodes) {
       const result = this.convertInlineNode(node, markDefs);
-      if (result) {
-        if (Array.isArray(result)) {
-          spans.push(...result);
-        } else {
-          spans.push(result);
+      if (!result) {
+        continue;
+      }
+
+      if (Array.isArray(result)) {
+        for (const span of result) {
+          spans.push(span);
         }
+      } else {
+        spans.push(result);
       }
     }
 
@@ -380,46 +406,49 @@ export class MarkdownImporter implements ImporterPlugin {
   }
 
   private convertText(node: Text, markDefs: any[]): PortableTextSpan | PortableTextSpan[] {
-    // Check for Obsidian wiki links [[Page Name]] or [[Page Name|Alias]]
-    const wikiLinkPattern = /\[\[([^\]|]+)(?:\|([^\]]+))?\]\]/g;
     const text = node.value;
 
-    // Check if text contains wiki links
-    if (wikiLinkPattern.test(text)) {
-      // Split text into spans with wiki links
-      const spans: PortableTextSpan[] = [];
-      let lastIndex = 0;
-      wikiLinkPattern.lastIndex = 0; // Reset regex state
-
-      let match;
-      while ((match = wikiLinkPattern.exec(text)) !== null) {
-        // Add text before the link
-        if (match.index > lastIndex) {
-          spans.push(createSpan(text.substring(lastIndex, match.index)));
-        }
+    // Fast path: most text nodes contain no Obsidian wiki links
+    if (!text.includes('[[')) {
+      return createSpan(text);
+    }
 
-        // Add wiki link
-        const markKey = generateKey();
-        markDefs.push({
-          _type: 'wikiLink',
-          _key: markKey,
-          target: match[1],
-          alias: match[2],
-        });
-        spans.push(createSpan(match[2] || match[1], [markKey]));
-
-        lastIndex = wikiLinkPattern.lastIndex;
+    // Split text into spans around [[Page Name]] / [[Page Name|Alias]] in one pass
+    const spans: PortableTextSpan[] = [];
+    let lastIndex = 0;
+    let match: RegExpExecArray | null;
+    WIKI_LINK_PATTERN.lastIndex = 0;
+
+    while ((match = WIKI_LINK_PATTERN.exec(text)) !== null) {
+      // Add text before the link
+      if (match.index > lastIndex) {
+        spans.push(createSpan(text.substring(lastIndex, match.index)));
       }
 
-      // Add remaining text
-      if (lastIndex < text.length) {
-        spans.push(createSpan(text.substring(lastIndex)));
-      }
+      // Add wiki link
+      const markKey = generateKey();
+      markDefs.push({
+        _type: 'wikiLink',
+        _key: markKey,
+        target: match[1],
+        alias: match[2],
+      });
+      spans.push(createSpan(match[2] || match[1], [markKey]));
+
+      lastIndex = WIKI_LINK_PATTERN.lastIndex;
+    }
 
-      return spans;
+    if (lastIndex === 0) {
+      // "[[" appeared but never formed a complete link
+      return createSpan(text);
     }
 
-    return createSpan(text);
+    // Add remaining text
+    if (lastIndex < text.length) {
+      spans.push(createSpan(text.substring(lastIndex)));
+    }
+
+    return spans;
   }
 
   private convertWithMark(
@@ -427,22 +456,7 @@ export class MarkdownImporter implements ImporterPlugin {
     mark: string,
     markDefs: any[]
   ): PortableTextSpan[] {
-    const spans: PortableTextSpan[] = [];
-
-    for (const node of nodes) {
-      const result = this.convertInlineNode(node, markDefs);
-      if (result) {
-        const nodeSpans = Array.isArray(result) ? result : [result];
-        for (const span of nodeSpans) {
-          spans.push({
-            ...span,
-            marks: [...(span.marks || []), mark],
-          });
-        }
-      }
-    }
-
-    return spans;
+    return this.applyMark(this.convertInlineNodes(nodes, markDefs), mark);
   }
 
   private convertLink(node: any, markDefs: any[]): PortableTextSpan[] {
@@ -454,17 +468,19 @@ export class MarkdownImporter implements ImporterPlugin {
       title: node.title,
     });
 
-    const spans: PortableTextSpan[] = [];
-    for (const child of node.children) {
-      const result = this.convertInlineNode(child, markDefs);
-      if (result) {
-        const nodeSpans = Array.isArray(result) ? result : [result];
-        for (const span of nodeSpans) {
-          spans.push({
-            ...span,
-            marks: [...(span.marks || []), markKey],
-          });
-        }
+    return this.applyMark(this.convertInlineNodes(node.children, markDefs), markKey);
+  }
+
+  /**
+   * Add a mark to freshly converted spans
+   * Spans and their marks arrays are created per conversion, so they are updated in place
+   */
+  private applyMark(spans: PortableTextSpan[], mark: string): PortableTextSpan[] {
+    for (const span of spans) {
+      if (span.marks) {
+        span.marks.push(mark);
+      } else {
+        span.marks = [mark];
       }
     }
 
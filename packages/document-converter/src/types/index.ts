@@ -35,10 +35,10 @@ export interface ConvertedDocument<T = any> {
 }
 
 /**
- * Portable Text specific document (for backward compatibility)
- * @deprecated Use ConvertedDocument<PortableTextBlock> instead
+ * Any block that can appear in Portable Text document content,
+ * discriminated on `_type`
  */
-export interface PortableTextDocument extends ConvertedDocument<
+export type PortableTextContentBlock =
   | PortableTextBlock
   | CodeBlock
   | ImageBlock
@@ -51,23 +51,14 @@ export interface PortableTextDocument extends ConvertedDocument<
   | ColumnListBlock
   | ChildPageBlock
   | TableOfContentsBlock
-  | LinkPreviewBlock
-> {
-  content: (
-    | PortableTextBlock
-    | CodeBlock
-    | ImageBlock
-    | CalloutBlock
-    | EmbedBlock
-    | TableBlock
-    | FileBlock
-    | VideoBlock
-    | AudioBlock
-    | ColumnListBlock
-    | ChildPageBlock
-    | TableOfContentsBlock
-    | LinkPreviewBlock
-  )[];
+  | LinkPreviewBlock;
+
+/**
+ * Portable Text specific document (for backward compatibility)
+ * @deprecated Use ConvertedDocument<PortableTextContentBlock> instead
+ */
+export interface PortableTextDocument extends ConvertedDocument<PortableTextContentBlock> {
+  content: PortableTextContentBlock[];
 }
 
 /**